@@ -141,8 +141,8 @@ class AssignLibraryReference(bpy.types.Operator, tool.Ifc.Operator):
     reference: bpy.props.IntProperty()
 
     def _execute(self, context):
-        core.assign_library_reference(
-            tool.Ifc, obj=context.active_object, reference=tool.Ifc.get().by_id(self.reference)
+        core.assign_library_references(
+            tool.Ifc, objs=context.selected_objects, reference=tool.Ifc.get().by_id(self.reference)
         )
 
 
@@ -153,6 +153,6 @@ class UnassignLibraryReference(bpy.types.Operator, tool.Ifc.Operator):
     reference: bpy.props.IntProperty()
 
     def _execute(self, context):
-        core.unassign_library_reference(
-            tool.Ifc, obj=context.active_object, reference=tool.Ifc.get().by_id(self.reference)
+        core.unassign_library_references(
+            tool.Ifc, objs=context.selected_objects, reference=tool.Ifc.get().by_id(self.reference)
         )
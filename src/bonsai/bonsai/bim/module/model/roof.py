@@ -18,15 +18,18 @@
 
 import bpy
 import bmesh
+import numpy as np
 
 import ifcopenshell
 import ifcopenshell.api
+import ifcopenshell.util.element
 import ifcopenshell.util.representation
 import ifcopenshell.util.unit
 import bonsai.core.root
 import bonsai.tool as tool
 from bonsai.bim.module.model.data import RoofData, refresh
 from bonsai.bim.module.model.decorator import ProfileDecorator
+from bonsai.tool.cad import VTX_PRECISION
 
 import json
 from math import cos, tan, pi, radians
@@ -94,9 +97,9 @@ class GenerateHippedRoof(bpy.types.Operator, tool.Ifc.Operator):
 
 def is_valid_roof_footprint(bm: bmesh.types.BMesh) -> tuple[set[str], str]:
     # should be bmesh to support edit mode
-    bm.verts.ensure_lookup_table()
-    base_z = bm.verts[0].co.z
-    all_verts_same_level = all([tool.Cad.is_x(v.co.z - base_z, 0) for v in bm.verts[1:]])
+    # bmesh has no foreach_get, so gather z coordinates once and compare them in a single vectorized pass
+    verts_z = np.fromiter((v.co.z for v in bm.verts), dtype=np.float64, count=len(bm.verts))
+    all_verts_same_level = bool(np.all(np.abs(verts_z[1:] - verts_z[0]) < VTX_PRECISION))
     if not all_verts_same_level:
         return (
             {"ERROR"},
@@ -430,12 +433,21 @@ def update_roof_modifier_ifc_data(context: bpy.types.Context) -> None:
     tool.Model.add_body_representation(obj)
 
 
-def update_bbim_roof_pset(element: ifcopenshell.entity_instance, roof_data: dict[str, Any]) -> None:
-    pset = tool.Pset.get_element_pset(element, "BBIM_Roof")
-    if not pset:
-        pset = ifcopenshell.api.run("pset.add_pset", tool.Ifc.get(), product=element, name="BBIM_Roof")
-    roof_data = tool.Ifc.get().createIfcText(json.dumps(roof_data, default=list))
-    ifcopenshell.api.run("pset.edit_pset", tool.Ifc.get(), pset=pset, properties={"Data": roof_data})
+def update_bbim_roof_pset(element: ifcopenshell.entity_instance, roof_data: dict[str, Any]) -> bool:
+    """returns `False` if pset already stores identical `roof_data` and was left untouched,
+    so callers can skip rebuilding roof geometry
+    """
+    ifc_file = tool.Ifc.get()
+    data = json.dumps(roof_data, default=list)
+    pset_data = ifcopenshell.util.element.get_pset(element, "BBIM_Roof")
+    if not pset_data:
+        pset = ifcopenshell.api.run("pset.add_pset", ifc_file, product=element, name="BBIM_Roof")
+    elif pset_data.get("Data") == data:
+        return False
+    else:
+        pset = ifc_file.by_id(pset_data["id"])
+    ifcopenshell.api.run("pset.edit_pset", ifc_file, pset=pset, properties={"Data": ifc_file.createIfcText(data)})
+    return True
 
 
 def update_roof_modifier_bmesh(obj: bpy.types.Object) -> None:
@@ -651,8 +663,9 @@ class FinishEditingRoof(bpy.types.Operator, tool.Ifc.Operator):
         roof_data["path_data"] = path_data
         props.is_editing = False
 
-        update_bbim_roof_pset(element, roof_data)
-        update_roof_modifier_ifc_data(context)
+        # roof geometry is already up to date if parameters were confirmed without changes
+        if update_bbim_roof_pset(element, roof_data):
+            update_roof_modifier_ifc_data(context)
         return {"FINISHED"}
 
 
@@ -766,7 +779,8 @@ class CopyRoofParameters(bpy.types.Operator, tool.Ifc.Operator):
             target_props = target_obj.BIMRoofProperties
 
             target_props.set_props_kwargs_from_ifc_data(data)
-            update_bbim_roof_pset(target_element, data)
+            if not update_bbim_roof_pset(target_element, data):
+                continue
             refresh()
             update_roof_modifier_bmesh(target_obj)
             update_roof_modifier_ifc_data(context)
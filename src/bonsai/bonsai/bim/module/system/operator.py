@@ -104,10 +104,9 @@ class AssignSystem(bpy.types.Operator, tool.Ifc.Operator):
     system: bpy.props.IntProperty()
 
     def _execute(self, context):
-        for obj in context.selected_objects:
-            element = tool.Ifc.get_entity(obj)
-            if element:
-                core.assign_system(tool.Ifc, system=tool.Ifc.get().by_id(self.system), product=element)
+        products = [element for o in context.selected_objects if (element := tool.Ifc.get_entity(o))]
+        if products:
+            core.assign_systems(tool.Ifc, system=tool.Ifc.get().by_id(self.system), products=products)
 
 
 class UnassignSystem(bpy.types.Operator, tool.Ifc.Operator):
@@ -117,10 +116,9 @@ class UnassignSystem(bpy.types.Operator, tool.Ifc.Operator):
     system: bpy.props.IntProperty()
 
     def _execute(self, context):
-        for obj in context.selected_objects:
-            element = tool.Ifc.get_entity(obj)
-            if element:
-                core.unassign_system(tool.Ifc, system=tool.Ifc.get().by_id(self.system), product=element)
+        products = [element for o in context.selected_objects if (element := tool.Ifc.get_entity(o))]
+        if products:
+            core.unassign_systems(tool.Ifc, system=tool.Ifc.get().by_id(self.system), products=products)
 
 
 class SelectSystemProducts(bpy.types.Operator):
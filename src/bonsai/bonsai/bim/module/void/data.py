@@ -19,6 +19,7 @@
 import bpy
 import ifcopenshell
 import bonsai.tool as tool
+from bonsai.bim.ifc import IfcStore
 from typing import Any, Generator, Union
 
 
@@ -30,61 +31,66 @@ def refresh():
 class VoidsData:
     data = {}
     is_loaded = False
+    # Element data by element id. Unlike `data` it's kept between loads
+    # and is only invalidated when IFC file changes or a new IFC transaction is made.
+    # Renames made outside of a transaction are caught by comparing the cached name.
+    element_data_cache: dict[int, dict[str, Any]] = {}
+    element_data_cache_key: tuple[Union[ifcopenshell.file, None], str] = (None, "")
 
     @classmethod
     def load(cls):
+        ifc_file = tool.Ifc.get()
+        cached_file, cached_transaction = cls.element_data_cache_key
+        if cached_file is not ifc_file or cached_transaction != IfcStore.last_transaction:
+            cls.element_data_cache = {}
+            cls.element_data_cache_key = (ifc_file, IfcStore.last_transaction)
+
+        cls.element = element = tool.Ifc.get_entity(bpy.context.active_object)
         cls.data = {
-            "active_opening": cls.active_opening(),
-            "openings": cls.openings(),
-            "fillings": cls.fillings(),
-            "voided_element": cls.voided_element(),
-            "filled_voids": cls.filled_voids(),
+            "active_opening": None,
+            "openings": [],
+            "fillings": [],
+            "voided_element": None,
+            "filled_voids": None,
         }
+        # Opening and voided / filling element relationships are mutually exclusive,
+        # so only the inverse attributes relevant to the element type are traversed.
+        if not element:
+            pass
+        elif element.is_a("IfcOpeningElement"):
+            cls.data["active_opening"] = element.id()
+            cls.data["fillings"] = cls.fillings(element)
+            cls.data["voided_element"] = cls.get_voided_element_data(element)
+        else:
+            cls.data["openings"] = cls.openings(element)
+            cls.data["filled_voids"] = cls.filled_voids(element)
         cls.is_loaded = True
 
     @classmethod
     def get_element_data(cls, element: ifcopenshell.entity_instance) -> dict[str, Any]:
-        return {"id": element.id(), "Name": element.Name or "Unnamed"}
-
-    @classmethod
-    def active_opening(cls):
-        element = tool.Ifc.get_entity(bpy.context.active_object)
-        cls.element = element
-        if element and element.is_a("IfcOpeningElement"):
-            cls.element = element
-            return element.id()
+        element_id = element.id()
+        name = element.Name or "Unnamed"
+        if (element_data := cls.element_data_cache.get(element_id)) is None or element_data["Name"] != name:
+            element_data = {"id": element_id, "Name": name}
+            cls.element_data_cache[element_id] = element_data
+        return element_data
 
     @classmethod
-    def openings(cls):
-        element = tool.Ifc.get_entity(bpy.context.active_object)
-        if not element:
-            return []
+    def openings(cls, element: ifcopenshell.entity_instance) -> list[dict[str, Any]]:
+        get_element_data = cls.get_element_data
         results = []
         for rel in getattr(element, "HasOpenings", []) or []:
-            has_fillings = []
             opening = rel.RelatedOpeningElement
-            for rel2 in getattr(opening, "HasFillings", []) or []:
-                filling = rel2.RelatedBuildingElement
-                has_fillings.append(cls.get_element_data(filling))
-
-            results.append(
-                cls.get_element_data(opening)
-                | {
-                    "HasFillings": has_fillings,
-                }
-            )
+            # IfcVoidingFeature has no HasFillings
+            fillings = getattr(opening, "HasFillings", []) or []
+            has_fillings = [get_element_data(rel2.RelatedBuildingElement) for rel2 in fillings]
+            results.append(get_element_data(opening) | {"HasFillings": has_fillings})
         return results
 
     @classmethod
-    def fillings(cls):
-        element = tool.Ifc.get_entity(bpy.context.active_object)
-        if not element:
-            return []
-        results = []
-        for rel in getattr(element, "HasFillings", []) or []:
-            filling = rel.RelatedBuildingElement
-            results.append(cls.get_element_data(filling))
-        return results
+    def fillings(cls, opening: ifcopenshell.entity_instance) -> list[dict[str, Any]]:
+        get_element_data = cls.get_element_data
+        return [get_element_data(rel.RelatedBuildingElement) for rel in opening.HasFillings]
 
     @classmethod
     def get_voided_element_data(cls, opening: ifcopenshell.entity_instance) -> Union[dict[str, Any], None]:
@@ -95,14 +101,8 @@ class VoidsData:
         return voids_elements
 
     @classmethod
-    def voided_element(cls) -> Union[dict[str, Any], None]:
-        if not (element := cls.element) or not element.is_a("IfcOpeningElement"):
-            return None
-        return cls.get_voided_element_data(element)
-
-    @classmethod
-    def filled_voids(cls) -> Union[dict[str, Any], None]:
-        if not (element := cls.element) or not (fills_voids := getattr(element, "FillsVoids", [])):
+    def filled_voids(cls, element: ifcopenshell.entity_instance) -> Union[dict[str, Any], None]:
+        if not (fills_voids := getattr(element, "FillsVoids", [])):
             return None
 
         opening = fills_voids[0].RelatingOpeningElement
@@ -118,35 +118,32 @@ class BooleansData:
 
     @classmethod
     def load(cls):
+        cls.obj, cls.representation = cls.resolve_representation()
         cls.data = {}
         cls.data["total_booleans"] = cls.booleans()
         cls.data["manual_booleans"] = cls.manual_booleans()
         cls.is_loaded = True
 
     @classmethod
-    def booleans(cls):
+    def resolve_representation(
+        cls,
+    ) -> Union[tuple[bpy.types.Object, ifcopenshell.entity_instance], tuple[None, None]]:
         props = tool.Geometry.get_geometry_props()
         obj = props.representation_obj or bpy.context.active_object
-        if (
-            not obj.data
-            or not hasattr(obj.data, "BIMMeshProperties")
-            or not obj.data.BIMMeshProperties.ifc_definition_id
-        ):
-            return []
+        if not (data := obj.data) or not (mesh_props := getattr(data, "BIMMeshProperties", None)):
+            return None, None
+        if not (ifc_definition_id := mesh_props.ifc_definition_id):
+            return None, None
+        return obj, tool.Ifc.get().by_id(ifc_definition_id)
 
-        representation = tool.Ifc.get().by_id(obj.data.BIMMeshProperties.ifc_definition_id)
+    @classmethod
+    def booleans(cls):
+        if not (representation := cls.representation):
+            return []
         return tool.Model.get_booleans(representation=representation)
 
     @classmethod
     def manual_booleans(cls):
-        props = tool.Geometry.get_geometry_props()
-        obj = props.representation_obj or bpy.context.active_object
-        if (
-            not obj.data
-            or not hasattr(obj.data, "BIMMeshProperties")
-            or not obj.data.BIMMeshProperties.ifc_definition_id
-        ):
+        if not (representation := cls.representation):
             return []
-
-        representation = tool.Ifc.get().by_id(obj.data.BIMMeshProperties.ifc_definition_id)
-        return tool.Model.get_manual_booleans(tool.Ifc.get_entity(obj), representation=representation)
+        return tool.Model.get_manual_booleans(tool.Ifc.get_entity(cls.obj), representation=representation)
@@ -167,21 +167,32 @@ class RemoveOpening(bpy.types.Operator, tool.Ifc.Operator):
     bl_label = "Remove Opening"
     bl_options = {"REGISTER", "UNDO"}
     opening_id: bpy.props.IntProperty()
+    opening_ids: bpy.props.StringProperty(
+        name="Opening IDs",
+        description="Comma separated ids of openings to remove at once. If provided, opening_id is ignored",
+    )
 
     def _execute(self, context):
-        opening = tool.Ifc.get().by_id(self.opening_id)
-        opening_obj = tool.Ifc.get_object(opening)
-        element = opening.VoidsElements[0].RelatingBuildingElement
-        obj = tool.Ifc.get_object(element)
-
-        if opening_obj:
-            opening_obj.name = "/".join(opening_obj.name.split("/")[1:])
-            tool.Ifc.unlink(element=opening)
+        ifc_file = tool.Ifc.get()
+        if self.opening_ids:
+            # Unique ids in order, tolerating stray separators, e.g. "12,12," removes #12 once.
+            opening_ids = dict.fromkeys(int(i) for i in self.opening_ids.split(",") if i.strip())
+            openings = [ifc_file.by_id(opening_id) for opening_id in opening_ids]
+        else:
+            openings = [ifc_file.by_id(self.opening_id)]
 
-        ifcopenshell.api.run("feature.remove_feature", tool.Ifc.get(), feature=opening)
+        elements: set[ifcopenshell.entity_instance] = set()
+        for opening in openings:
+            elements.add(opening.VoidsElements[0].RelatingBuildingElement)
+            if opening_obj := tool.Ifc.get_object(opening):
+                opening_obj.name = "/".join(opening_obj.name.split("/")[1:])
+                tool.Ifc.unlink(element=opening)
+            ifcopenshell.api.run("feature.remove_feature", ifc_file, feature=opening)
 
-        decomposed_building_elements = {element}
-        decomposed_building_elements.update(tool.Aggregate.get_parts_recursively(element))
+        # Reload geometry once per affected element, no matter how many of its openings were removed.
+        decomposed_building_elements = set(elements)
+        for element in elements:
+            decomposed_building_elements.update(tool.Aggregate.get_parts_recursively(element))
 
         for building_element in decomposed_building_elements:
             building_obj = tool.Ifc.get_object(building_element)
@@ -197,8 +208,9 @@ class RemoveOpening(bpy.types.Operator, tool.Ifc.Operator):
                     is_global=True,
                     should_sync_changes_first=False,
                 )
-        tool.Geometry.unlock_scale_object_with_openings(obj)
-        tool.Geometry.clear_cache(element)
+        for element in elements:
+            tool.Geometry.unlock_scale_object_with_openings(tool.Ifc.get_object(element))
+            tool.Geometry.clear_cache(element)
         return {"FINISHED"}
 
 
@@ -230,12 +242,26 @@ class RemoveFilling(bpy.types.Operator, tool.Ifc.Operator):
     bl_label = "Remove Filling"
     bl_options = {"REGISTER", "UNDO"}
     filling: bpy.props.IntProperty()
+    fillings: bpy.props.StringProperty(
+        name="Filling IDs",
+        description="Comma separated ids of fillings to remove at once. If provided, filling is ignored",
+    )
 
     def _execute(self, context):
-        filling = tool.Ifc.get().by_id(self.filling)
-        for rel in filling.FillsVoids:
-            bpy.ops.bim.remove_opening(opening_id=rel.RelatingOpeningElement.id())
-        ifcopenshell.api.run("feature.remove_filling", tool.Ifc.get(), element=filling)
+        ifc_file = tool.Ifc.get()
+        if self.fillings:
+            filling_ids = dict.fromkeys(int(i) for i in self.fillings.split(",") if i.strip())
+            fillings = [ifc_file.by_id(filling_id) for filling_id in filling_ids]
+        else:
+            fillings = [ifc_file.by_id(self.filling)]
+
+        opening_ids = dict.fromkeys(
+            rel.RelatingOpeningElement.id() for filling in fillings for rel in filling.FillsVoids
+        )
+        if opening_ids:
+            bpy.ops.bim.remove_opening(opening_ids=",".join(map(str, opening_ids)))
+        for filling in fillings:
+            ifcopenshell.api.run("feature.remove_filling", ifc_file, element=filling)
         return {"FINISHED"}
 
 
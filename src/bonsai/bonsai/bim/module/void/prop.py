@@ -49,5 +49,7 @@ class BIMBooleanProperties(PropertyGroup):
 
     @property
     def active_boolean(self) -> Union[Boolean, None]:
-        if self.booleans and 0 <= self.active_boolean_index < len(self.booleans):
-            return self.booleans[self.active_boolean_index]
+        # Not cached between calls: RNA item references become invalid once the collection is modified.
+        booleans = self.booleans
+        if 0 <= (index := self.active_boolean_index) < len(booleans):
+            return booleans[index]
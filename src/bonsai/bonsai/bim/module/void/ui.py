@@ -30,6 +30,11 @@ if TYPE_CHECKING:
 OPENING_ICON = "SELECT_SUBTRACT"
 FILLING_ICON = "SELECT_INTERSECT"
 VOIDED_ELEMENT_ICON = "SELECT_EXTEND"
+BOOLEAN_OPERATOR_ICONS: dict[str, rna_enums.IconItems] = {
+    "DIFFERENCE": "SELECT_DIFFERENCE",
+    "INTERSECTION": "SELECT_INTERSECT",
+    "UNION": "SELECT_EXTEND",
+}
 
 
 class BIM_PT_voids(Panel):
@@ -136,9 +141,6 @@ class BIM_PT_booleans(Panel):
         )
 
     def draw(self, context):
-        if not BooleansData.is_loaded:
-            BooleansData.load()
-
         obj = context.active_object
         assert obj
 
@@ -148,6 +150,9 @@ class BIM_PT_booleans(Panel):
         props = context.scene.BIMBooleanProperties
 
         if context.active_object.data.BIMMeshProperties.ifc_definition_id:
+            # Booleans data is only used for the summary, editing UI is drawn from BIMBooleanProperties.
+            if not BooleansData.is_loaded:
+                BooleansData.load()
             row = layout.row(align=True)
             total_booleans = BooleansData.data["total_booleans"]
             manual_booleans = BooleansData.data["manual_booleans"]
@@ -180,17 +185,11 @@ class BIM_PT_booleans(Panel):
 class BIM_UL_booleans(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
         if item:
-            if item.operator == "DIFFERENCE":
-                icon = "SELECT_DIFFERENCE"
-            elif item.operator == "INTERSECTION":
-                icon = "SELECT_INTERSECT"
-            elif item.operator == "UNION":
-                icon = "SELECT_EXTEND"
-            elif "IfcHalfSpaceSolid" in item.name:
-                icon = "NORMALS_FACE"
-            else:
-                icon = "MESH_DATA"
+            if (icon := BOOLEAN_OPERATOR_ICONS.get(item.operator)) is None:
+                icon = "NORMALS_FACE" if "IfcHalfSpaceSolid" in item.name else "MESH_DATA"
             row = layout.row(align=True)
-            for i in range(0, item.level):
-                row.label(text="", icon="BLANK1")
+            if item.level:
+                # Single spacer instead of a blank icon per level.
+                # Separator factor is in 0.3 UI units, blank icon takes a full unit.
+                row.separator(factor=item.level / 0.3, type="SPACE")
             row.label(text=item.name, icon=icon)
@@ -16,9 +16,16 @@
 # You should have received a copy of the GNU General Public License
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import ifcopenshell
 import ifcopenshell.util.pset
 import bonsai.tool as tool
+from pathlib import Path
+from typing import Union
+
+# Parsed pset template files by path, along with the (mtime, size) they were parsed at.
+# Templates are reloaded after every pset template edit, so files are only reparsed if they changed on disk.
+_template_files: dict[str, tuple[tuple[int, int], ifcopenshell.file]] = {}
 
 
 class IfcSchema:
@@ -38,17 +45,39 @@ class IfcSchema:
             "IfcElementType",
             "IfcAnnotation",
         ]
-        self.load_pset_templates()
+        self._psetqto: Union[ifcopenshell.util.pset.PsetQto, None] = None
+
+    @property
+    def psetqto(self) -> ifcopenshell.util.pset.PsetQto:
+        # Templates are loaded on first use rather than on addon startup.
+        if self._psetqto is None:
+            self.load_pset_templates()
+        return self._psetqto
 
     def load_pset_templates(self):
-        self.psetqto = ifcopenshell.util.pset.get_template(self.schema_identifier)
+        psetqto = ifcopenshell.util.pset.get_template(self.schema_identifier)
         # Keep only the first template, which is the official buildingSMART one
-        self.psetqto.templates = self.psetqto.templates[0:1]
-        self.psetqto.get_applicable.cache_clear()
-        self.psetqto.get_applicable_names.cache_clear()
-        self.psetqto.get_by_name.cache_clear()
+        psetqto.templates = psetqto.templates[0:1]
+        psetqto.get_applicable.cache_clear()
+        psetqto.get_applicable_names.cache_clear()
+        psetqto.get_by_name.cache_clear()
+        # Parsed serially on purpose: ifcopenshell.open holds the GIL while parsing, so a thread pool
+        # wouldn't parse files concurrently. Unchanged files are served from _template_files anyway.
         for path in tool.Blender.get_data_dir_paths("pset", "*.ifc"):
-            self.psetqto.templates.append(ifcopenshell.open(path))
+            psetqto.templates.append(open_template_file(path))
+        self._psetqto = psetqto
+
+
+def open_template_file(path: Union[str, Path]) -> ifcopenshell.file:
+    path = str(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _template_files.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    template_file = ifcopenshell.open(path)
+    _template_files[path] = (signature, template_file)
+    return template_file
 
 
 ifc = IfcSchema()
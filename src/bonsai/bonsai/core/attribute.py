@@ -28,19 +28,21 @@ if TYPE_CHECKING:
 def copy_attribute_to_selection(
     ifc: tool.Ifc, blender: tool.Blender, root: tool.Root, spatial: tool.Spatial, name: str, value: Union[str, None]
 ) -> int:
-    total_changed = 0
-    has_edited_spatial_name = False
+    attributes = {name: value}
+    edited: list[tuple[bpy.types.Object, ifcopenshell.entity_instance]] = []
     for obj in blender.get_selected_objects(include_active=False):
-        if element := ifc.get_entity(obj):
-            try:
-                ifc.run("attribute.edit_attributes", product=element, attributes={name: value})
-                if name in ("Name", "AxisTag"):
-                    root.set_object_name(obj, element)
-                if name in ("Name", "LongName") and root.is_spatial_element(element):
-                    has_edited_spatial_name = True
-                total_changed += 1
-            except:
-                pass
-    if has_edited_spatial_name:
+        if not (element := ifc.get_entity(obj)) or not root.has_attribute(element, name):
+            continue
+        try:
+            ifc.run("attribute.edit_attributes", product=element, attributes=attributes)
+        except Exception:
+            # Value may still be invalid for this element, e.g. a PredefinedType enum of a different class.
+            continue
+        edited.append((obj, element))
+
+    if name in ("Name", "AxisTag"):
+        for obj, element in edited:
+            root.set_object_name(obj, element)
+    if name in ("Name", "LongName") and any(root.is_spatial_element(element) for _, element in edited):
         spatial.import_spatial_decomposition()
-    return total_changed
+    return len(edited)
@@ -17,7 +17,7 @@
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 if TYPE_CHECKING:
     import bpy
@@ -92,8 +92,22 @@ def edit_library_reference(ifc: tool.Ifc, library: tool.Library) -> None:
 
 
 def assign_library_reference(ifc: tool.Ifc, obj: bpy.types.Object, reference: ifcopenshell.entity_instance) -> None:
-    ifc.run("library.assign_reference", products=[ifc.get_entity(obj)], reference=reference)
+    assign_library_references(ifc, [obj], reference)
+
+
+def assign_library_references(
+    ifc: tool.Ifc, objs: Iterable[bpy.types.Object], reference: ifcopenshell.entity_instance
+) -> None:
+    if products := [element for obj in objs if (element := ifc.get_entity(obj))]:
+        ifc.run("library.assign_reference", products=products, reference=reference)
 
 
 def unassign_library_reference(ifc: tool.Ifc, obj: bpy.types.Object, reference: ifcopenshell.entity_instance) -> None:
-    ifc.run("library.unassign_reference", products=[ifc.get_entity(obj)], reference=reference)
+    unassign_library_references(ifc, [obj], reference)
+
+
+def unassign_library_references(
+    ifc: tool.Ifc, objs: Iterable[bpy.types.Object], reference: ifcopenshell.entity_instance
+) -> None:
+    if products := [element for obj in objs if (element := ifc.get_entity(obj))]:
+        ifc.run("library.unassign_reference", products=products, reference=reference)
@@ -56,14 +56,15 @@ def disable_structural_analysis_model_editing_ui(structural: tool.Structural) ->
 
 def edit_structural_analysis_model(ifc: tool.Ifc, structural: tool.Structural) -> None:
     attributes = structural.get_structural_analysis_model_attributes()
+    model = structural.get_active_structural_analysis_model()
     ifc.run(
         "structural.edit_structural_analysis_model",
         **{
-            "structural_analysis_model": structural.get_active_structural_analysis_model(),
+            "structural_analysis_model": model,
             "attributes": attributes,
         },
     )
-    structural.load_structural_analysis_models()
+    structural.update_structural_analysis_model(model)
     structural.disable_editing_structural_analysis_model()
 
 
@@ -93,7 +94,7 @@ def remove_structural_analysis_model(ifc: tool.Ifc, structural: tool.Structural,
         "structural.remove_structural_analysis_model",
         **{"structural_analysis_model": ifc.get().by_id(model)},
     )
-    structural.load_structural_analysis_models()
+    structural.unload_structural_analysis_model(model)
 
 
 def unassign_structural_analysis_model(
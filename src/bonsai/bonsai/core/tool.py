@@ -756,6 +756,7 @@ class Root:
     def get_object_name(cls, obj): pass
     def get_object_representation(cls, obj): pass
     def get_representation_context(cls, representation): pass
+    def has_attribute(cls, element, name): pass
     def is_containable(cls, element): pass
     def is_drawing_annotation(cls, element): pass
     def is_element_a(cls, element, ifc_class): pass
@@ -999,6 +1000,8 @@ class Structural:
     def get_structural_analysis_model_attributes(cls): pass
     def load_structural_analysis_model_attributes(cls, data): pass
     def load_structural_analysis_models(cls): pass
+    def unload_structural_analysis_model(cls, model): pass
+    def update_structural_analysis_model(cls, model): pass
 
 
 @interface
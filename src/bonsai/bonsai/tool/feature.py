@@ -17,10 +17,11 @@
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import bonsai.core.geometry
 import bonsai.core.tool
 import bonsai.tool as tool
-import bonsai.bim.helper
 import ifcopenshell
+import ifcopenshell.api.feature
 from typing import Iterable
 
 
@@ -30,12 +31,7 @@ class Feature(bonsai.core.tool.Feature):
     @classmethod
     def add_feature(cls, featured_obj: bpy.types.Object, feature_objs: Iterable[bpy.types.Object]) -> None:
         featured_element = tool.Ifc.get_entity(featured_obj)
-
-        has_visible_openings = False
-        for opening in [r.RelatedOpeningElement for r in featured_element.HasOpenings]:
-            if tool.Ifc.get_object(opening):
-                has_visible_openings = True
-                break
+        ifc_file = tool.Ifc.get()
 
         for feature_obj in feature_objs:
             feature_element = tool.Ifc.get_entity(feature_obj)
@@ -45,31 +41,30 @@ class Feature(bonsai.core.tool.Feature):
                 bonsai.core.geometry.edit_object_placement(tool.Ifc, tool.Geometry, tool.Surveyor, obj=featured_obj)
 
             element_had_openings = tool.Geometry.has_openings(featured_element)
-            body_context = ifcopenshell.util.representation.get_context(tool.Ifc.get(), "Model", "Body")
-            ifcopenshell.api.run(
-                "feature.add_feature", tool.Ifc.get(), feature=feature_element, element=featured_element
-            )
+            ifcopenshell.api.feature.add_feature(ifc_file, feature=feature_element, element=featured_element)
 
             if tool.Ifc.is_moved(feature_obj):
                 bonsai.core.geometry.edit_object_placement(tool.Ifc, tool.Geometry, tool.Surveyor, obj=feature_obj)
 
-        voided_objs = [featured_obj]
+        # Keep elements along with objects, so they don't have to be looked up back from objects.
+        voided_objs = [(featured_obj, featured_element)]
         for subelement in tool.Aggregate.get_parts_recursively(featured_element):
             if subobj := tool.Ifc.get_object(subelement):
-                voided_objs.append(subobj)
+                voided_objs.append((subobj, subelement))
 
-        for voided_obj in voided_objs:
+        is_edited, is_moved = tool.Ifc.is_edited, tool.Ifc.is_moved
+        reload_representation, lock_scale = tool.Geometry.reload_representation, tool.Geometry.lock_scale
+        for voided_obj, voided_element_ in voided_objs:
             if voided_obj.data:
-                if tool.Ifc.is_edited(voided_obj):
-                    voided_element_ = tool.Ifc.get_entity(voided_obj)
+                if is_edited(voided_obj):
                     if element_had_openings or (voided_element_ != featured_element and voided_element_.HasOpenings):
                         voided_obj.scale = (1.0, 1.0, 1.0)
                         tool.Ifc.finish_edit(voided_obj)
                     else:
                         bpy.ops.bim.update_representation(obj=voided_obj.name)
 
-                if tool.Ifc.is_moved(voided_obj):
+                if is_moved(voided_obj):
                     bonsai.core.geometry.edit_object_placement(tool.Ifc, tool.Geometry, tool.Surveyor, obj=voided_obj)
 
-                tool.Geometry.reload_representation(voided_obj)
-            tool.Geometry.lock_scale(voided_obj)
+                reload_representation(voided_obj)
+            lock_scale(voided_obj)
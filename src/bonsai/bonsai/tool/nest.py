@@ -20,6 +20,7 @@ import bpy
 import bonsai.core.tool
 import bonsai.tool as tool
 import ifcopenshell.util.element
+from collections import deque
 
 
 class Nest(bonsai.core.tool.Nest):
@@ -27,11 +28,12 @@ class Nest(bonsai.core.tool.Nest):
     def can_nest(cls, relating_obj, related_obj):
         relating_object = tool.Ifc.get_entity(relating_obj)
         related_object = tool.Ifc.get_entity(related_obj)
-        if not relating_object or not related_object:
-            return False
-        if relating_object.is_a("IfcElement") and related_object.is_a("IfcElement"):
-            return True
-        return False
+        return bool(
+            relating_object
+            and related_object
+            and relating_object.is_a("IfcElement")
+            and related_object.is_a("IfcElement")
+        )
 
     @classmethod
     def disable_editing(cls, obj):
@@ -51,13 +53,15 @@ class Nest(bonsai.core.tool.Nest):
 
     @classmethod
     def get_components_recursively(cls, element: ifcopenshell.entity_instance) -> set[ifcopenshell.entity_instance]:
-        """Get elements components recursively, resulting set includes `element`."""
+        """Get elements components recursively, resulting set doesn't include `element` itself."""
+        get_components = ifcopenshell.util.element.get_components
         components = set()
-        queue = {element}
+        queue = deque((element,))
         while queue:
-            element = queue.pop()
-            queue.update(new_components := set(ifcopenshell.util.element.get_components(element)))
-            components.update(new_components)
+            for component in get_components(queue.popleft()):
+                if component not in components:
+                    components.add(component)
+                    queue.append(component)
         return components
 
     @classmethod
@@ -79,24 +83,23 @@ class Nest(bonsai.core.tool.Nest):
         if not components:
             components = ifcopenshell.util.element.get_components(nest)
         if components:
-            props.editing_nest = tool.Ifc.get_object(nest) if nest else tool.Ifc.get_object(element)
-            components_objs = [tool.Ifc.get_object(component) for component in components]
-            objs = []
-            visible_objects = tool.Raycast.get_visible_objects(context)
-            for obj in visible_objects:
-                if obj.visible_in_viewport_get(context.space_data):
-                    objs.append(obj.original)
-            for obj in objs:
-                if obj.original not in components_objs:
-                    if obj == props.editing_nest:
-                        continue
-                    not_editing_obj = props.not_editing_objects.add()
-                    not_editing_obj.obj = obj.original
-                    not_editing_obj.previous_display_type = obj.original.display_type
-                    obj.original.display_type = "WIRE"
-                else:
+            props.editing_nest = editing_nest = tool.Ifc.get_object(nest) if nest else tool.Ifc.get_object(element)
+            components_objs = {obj for component in components if (obj := tool.Ifc.get_object(component))}
+            space_data = context.space_data
+            for obj in tool.Raycast.get_visible_objects(context):
+                if not obj.visible_in_viewport_get(space_data):
+                    continue
+                obj = obj.original
+                if obj in components_objs:
                     editing_obj = props.editing_objects.add()
-                    editing_obj.obj = obj.original
+                    editing_obj.obj = obj
+                elif obj != editing_nest:
+                    not_editing_obj = props.not_editing_objects.add()
+                    not_editing_obj.obj = obj
+                    # Objects already in WIRE are still tracked, they're consulted as not editing elsewhere.
+                    not_editing_obj.previous_display_type = obj.display_type
+                    if obj.display_type != "WIRE":
+                        obj.display_type = "WIRE"
 
         props.in_nest_mode = True
         return {"FINISHED"}
@@ -105,15 +108,11 @@ class Nest(bonsai.core.tool.Nest):
     def disable_nest_mode(cls):
         context = bpy.context
         props = context.scene.BIMNestProperties
+        # Objects were stored as originals in enable_nest_mode.
         for obj_prop in props.not_editing_objects:
-            obj = obj_prop.obj
-            obj.original.display_type = obj_prop.previous_display_type
-            element = tool.Ifc.get_entity(obj)
-            if not element:
-                continue
+            if (obj := obj_prop.obj) and obj.display_type != obj_prop.previous_display_type:
+                obj.display_type = obj_prop.previous_display_type
 
-        components = ifcopenshell.util.element.get_components(tool.Ifc.get_entity(props.editing_nest))
-        objs = [tool.Ifc.get_object(component) for component in components]
         if context.space_data.local_view:
             bpy.ops.view3d.localview()
 
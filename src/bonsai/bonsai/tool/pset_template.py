@@ -20,8 +20,6 @@ from __future__ import annotations
 import bpy
 import ifcopenshell
 import ifcopenshell.api.pset_template
-import ifcopenshell.util.attribute
-import ifcopenshell.util.element
 import bonsai.core.tool
 import bonsai.tool as tool
 from pathlib import Path
@@ -66,8 +64,9 @@ class PsetTemplate(bonsai.core.tool.PsetTemplate):
     ) -> ifcopenshell.entity_instance:
         # TODO: add tests.
         pset_template = ifcopenshell.api.pset_template.add_pset_template(template_file, pset.Name)
+        add_prop_template = ifcopenshell.api.pset_template.add_prop_template
         for property in pset.HasProperties:
-            ifcopenshell.api.pset_template.add_prop_template(
+            add_prop_template(
                 template_file,
                 pset_template,
                 name=property.Name,
@@ -105,18 +104,19 @@ class PsetTemplate(bonsai.core.tool.PsetTemplate):
         pset_template_file = IfcStore.pset_template_file
         assert pset_template_file
         template = pset_template_file.by_id(props.active_prop_template_id)
-        props.active_prop_template.name = template.Name or ""
-        props.active_prop_template.description = template.Description or ""
-        props.active_prop_template.primary_measure_type = template.PrimaryMeasureType or "-"
-        props.active_prop_template.template_type = template.TemplateType
-        props.active_prop_template.enum_values.clear()
+        active_prop_template = props.active_prop_template
+        active_prop_template.name = template.Name or ""
+        active_prop_template.description = template.Description or ""
+        active_prop_template.primary_measure_type = template.PrimaryMeasureType or "-"
+        active_prop_template.template_type = template.TemplateType
+        enum_values = active_prop_template.enum_values
+        enum_values.clear()
 
         if template.Enumerators:
-            props.active_prop_template.enum_values.clear()
-            data_type = props.active_prop_template.get_value_name()
+            data_type = active_prop_template.get_value_name()
+            add_enum_value = enum_values.add
             for e in template.Enumerators.EnumerationValues:
-                new = props.active_prop_template.enum_values.add()
-                setattr(new, data_type, e.wrappedValue)
+                setattr(add_enum_value(), data_type, e.wrappedValue)
 
         # Disable because of the intersecting enums in data.py.
         props.active_pset_template_id = 0
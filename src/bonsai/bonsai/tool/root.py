@@ -204,6 +204,11 @@ class Root(bonsai.core.tool.Root):
             return False
         return True
 
+    @classmethod
+    def has_attribute(cls, element: ifcopenshell.entity_instance, name: str) -> bool:
+        # get_argument_index returns 0xFFFFFFFF if attribute is not found
+        return element.wrapped_data.get_argument_index(name) != 0xFFFFFFFF
+
     @classmethod
     def is_element_a(cls, element: ifcopenshell.entity_instance, ifc_class: str) -> bool:
         return element.is_a(ifc_class)
@@ -17,19 +17,52 @@
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import bmesh
+import bisect
 import ifcopenshell
+import ifcopenshell.util.unit
 import bonsai.core.tool
 import bonsai.tool as tool
+from bonsai.bim.ifc import IfcStore
 from bonsai.bim.module.model.decorator import PolylineDecorator
 import math
 import mathutils
 from mathutils import Matrix, Vector
 from lark import Lark, Transformer
+from functools import lru_cache
+
+FLT_EPSILON = 1.1920928955078125e-07
+
+# Polar snap angles with cosine and sine of the rotation bringing each of them onto the pivot axis,
+# i.e. of math.radians(360 - angle), as used by Matrix.Rotation in Snap.snap_on_axis.
+SNAP_AXIS_ROTATIONS = tuple(
+    (angle, math.cos(math.radians(360 - angle)), math.sin(math.radians(360 - angle))) for angle in range(30, 361, 30)
+)
+# Rotation matrices and their inverses for the polar snap angles around each pivot axis.
+# Shared between calls, so they must never be modified in place.
+SNAP_AXIS_MATRICES = {
+    (angle, pivot_axis): (rot_mat, rot_mat.inverted())
+    for angle, _, _ in SNAP_AXIS_ROTATIONS
+    for pivot_axis in "XYZ"
+    for rot_mat in (Matrix.Rotation(math.radians(360 - angle), 3, pivot_axis),)
+}
 
 
 class Snap(bonsai.core.tool.Snap):
     tool_state = None
     snap_plane_method = None
+    unit_scale = 1.0
+    unit_scale_key = (None, None)
+
+    @classmethod
+    def get_unit_scale(cls) -> float:
+        """Get the project unit scale, recalculated only when the file or its last transaction changes."""
+        ifc_file = tool.Ifc.get()
+        cached_file, cached_transaction = cls.unit_scale_key
+        if cached_file is not ifc_file or cached_transaction != IfcStore.last_transaction:
+            cls.unit_scale = ifcopenshell.util.unit.calculate_unit_scale(ifc_file)
+            cls.unit_scale_key = (ifc_file, IfcStore.last_transaction)
+        return cls.unit_scale
 
     @classmethod
     def set_snap_plane_method(cls, value=True):
@@ -47,55 +80,34 @@ class Snap(bonsai.core.tool.Snap):
         rv3d = context.region_data
 
         factor = 1
-        fractions = [100, 20, 10, 2]
-        ortho_threshold = [-0.5, -0.25, -0.15, -0.05]
-        distances = [3, 5, 15, 30]
+        fractions = (100, 20, 10, 2)
+        ortho_threshold = (-0.5, -0.25, -0.15, -0.05)
+        distances = (3, 5, 15, 30)
 
         unit_system = tool.Drawing.get_unit_system()
-        unit_scale = ifcopenshell.util.unit.calculate_unit_scale(tool.Ifc.get())
         if unit_system == "IMPERIAL":
-            factor = unit_scale
-            fractions = [24, 12, 6, 2]
-            ortho_threshold = [-10.0, -4.75, -2.2, -0.75]
-            distances = [3, 6, 10, 20]
+            factor = cls.get_unit_scale()
+            fractions = (24, 12, 6, 2)
+            ortho_threshold = (-10.0, -4.75, -2.2, -0.75)
+            distances = (3, 6, 10, 20)
 
-        increment = None
+        # Thresholds are sorted, so the first one above the current zoom level picks the fraction.
+        # Zooming out beyond the last one snaps to whole units.
         if rv3d.view_perspective == "PERSP":
-            if rv3d.view_distance < distances[0]:
-                increment = (1 / fractions[0]) * factor
-            elif distances[0] < rv3d.view_distance < distances[1]:
-                increment = (1 / fractions[1]) * factor
-            elif distances[1] < rv3d.view_distance < distances[2]:
-                increment = (1 / fractions[2]) * factor
-            elif distances[2] < rv3d.view_distance < distances[3]:
-                increment = (1 / fractions[3]) * factor
-            else:
-                increment = 1 * factor
-        if rv3d.view_perspective == "ORTHO" or (
+            i = bisect.bisect_left(distances, rv3d.view_distance)
+        elif rv3d.view_perspective == "ORTHO" or (
             rv3d.view_perspective == "CAMERA" and context.scene.camera.data.type == "ORTHO"
         ):
-            window_scale = rv3d.window_matrix.to_scale()
-            if window_scale[1] < ortho_threshold[0]:
-                increment = (1 / fractions[0]) * factor
-            elif ortho_threshold[0] < window_scale[1] < ortho_threshold[1]:
-                increment = (1 / fractions[1]) * factor
-            elif ortho_threshold[1] < window_scale[1] < ortho_threshold[2]:
-                increment = (1 / fractions[2]) * factor
-            elif ortho_threshold[2] < window_scale[1] < ortho_threshold[3]:
-                increment = (1 / fractions[3]) * factor
-            else:
-                increment = 1 * factor
+            i = bisect.bisect_left(ortho_threshold, rv3d.window_matrix.to_scale()[1])
+        else:
+            return None
 
+        increment = (1 / fractions[i] if i < len(fractions) else 1) * factor
         return increment
 
     @classmethod
     def get_snap_points_on_raycasted_face(cls, context, event, obj, face_index):
-        matrix = obj.matrix_world.copy()
         face = obj.data.polygons[face_index]
-        verts = []
-        for i in face.vertices:
-            verts.append(matrix @ obj.data.vertices[i].co)
-
         hit, hit_type = tool.Raycast.ray_cast_by_proximity(context, event, obj, face)
         snap_point = (hit, hit_type)
         if hit is None:
@@ -105,14 +117,10 @@ class Snap(bonsai.core.tool.Snap):
 
     @classmethod
     def update_snapping_point(cls, snap_point, snap_type, snap_obj=None):
-        try:
-            snap_vertex = bpy.context.scene.BIMPolylineProperties.snap_mouse_point[0]
-        except:
-            snap_vertex = bpy.context.scene.BIMPolylineProperties.snap_mouse_point.add()
+        snap_mouse_point = bpy.context.scene.BIMPolylineProperties.snap_mouse_point
+        snap_vertex = snap_mouse_point[0] if len(snap_mouse_point) else snap_mouse_point.add()
 
-        snap_vertex.x = snap_point[0]
-        snap_vertex.y = snap_point[1]
-        snap_vertex.z = snap_point[2]
+        snap_vertex.x, snap_vertex.y, snap_vertex.z = snap_point[:3]
         snap_vertex.snap_type = snap_type
         if snap_obj:
             snap_vertex.snap_object = snap_obj.name
@@ -125,14 +133,10 @@ class Snap(bonsai.core.tool.Snap):
 
     @classmethod
     def update_snapping_ref(cls, snap_point, snap_type):
-        try:
-            snap_vertex = bpy.context.scene.BIMPolylineProperties.snap_mouse_ref[0]
-        except:
-            snap_vertex = bpy.context.scene.BIMPolylineProperties.snap_mouse_ref.add()
+        snap_mouse_ref = bpy.context.scene.BIMPolylineProperties.snap_mouse_ref
+        snap_vertex = snap_mouse_ref[0] if len(snap_mouse_ref) else snap_mouse_ref.add()
 
-        snap_vertex.x = snap_point[0]
-        snap_vertex.y = snap_point[1]
-        snap_vertex.z = snap_point[2]
+        snap_vertex.x, snap_vertex.y, snap_vertex.z = snap_point[:3]
         snap_vertex.snap_type = snap_type
 
     @classmethod
@@ -141,37 +145,17 @@ class Snap(bonsai.core.tool.Snap):
 
     @classmethod
     def snap_on_axis(cls, intersection, tool_state, lock_angle=False):
-        def create_axis_line_data(rot_mat, origin):
+        def create_axis_line_data(rot_mat_inv, origin):
             length = 1000
             direction = Vector((1, 0, 0))
             if tool_state.plane_method == "YZ" or (not tool_state.plane_method and tool_state.axis_method == "Z"):
                 direction = Vector((0, 0, 1))
-            rot_dir = rot_mat.inverted() @ direction
+            rot_dir = rot_mat_inv @ direction
             start = origin + rot_dir * length
             end = origin - rot_dir * length
 
             return start, end
 
-        def create_axis_rectangle_data(origin):
-            size = 0.5
-            direction = Vector((1, 0, 0))
-            if tool_state.plane_method == "YZ":
-                direction = Vector((0, 0, 1))
-            rot_mat = Matrix.Rotation(math.radians(360), 3, pivot_axis)
-            rot_dir = rot_mat.inverted() @ direction
-            v1 = origin + rot_dir * 0
-            v2 = origin + rot_dir * size
-            if tool_state.plane_method == "XY":
-                angle = 270
-            else:
-                angle = 90
-            rot_mat = Matrix.Rotation(math.radians(angle), 3, pivot_axis)
-            rot_dir = rot_mat.inverted() @ direction
-            v3 = origin + rot_dir * size
-            v4 = v2 + rot_dir * size
-
-            return (v1, v2, v3, v4)
-
         # Makes the snapping point more or less sticky than others
         # It changes the distance and affects how the snapping point is sorted
         stick_factor = 0.15
@@ -187,47 +171,48 @@ class Snap(bonsai.core.tool.Snap):
 
         # Translates intersection point based on last_point
         translated_intersection = intersection - last_point
-        snap_axis = []
         if not tool_state.lock_axis:
-            for i in range(1, 13):
-                angle = 30 * i
-                snap_axis.append(angle)
+            snap_axis = SNAP_AXIS_ROTATIONS
+        elif tool_state.snap_angle:
+            angle = math.radians(360 - tool_state.snap_angle)
+            snap_axis = ((tool_state.snap_angle, math.cos(angle), math.sin(angle)),)
         else:
-            snap_axis = [tool_state.snap_angle]
+            snap_axis = ()
 
+        # Proximity is the component of the intersection rotated around the pivot axis
+        # that should be zero on the snap axis, computed as cos * a + sin * b.
+        x, y, z = translated_intersection
         pivot_axis = "Z"
+        a, b = y, x
         if tool_state.plane_method == "XZ":
             pivot_axis = "Y"
+            a, b = z, -x
         if tool_state.plane_method == "YZ":
             pivot_axis = "X"
+            a, b = y, -z
 
-        # Get axis that are closer than the stick factor threshold
-        elegible_axis = []
-
-        for axis in snap_axis:
-            if not axis:
-                continue
-            rot_mat = Matrix.Rotation(math.radians(360 - axis), 3, pivot_axis)
-            rot_intersection = rot_mat @ translated_intersection
-            proximity = rot_intersection.y
-            if tool_state.plane_method == "XZ":
-                proximity = rot_intersection.z
+        # Get the axis with the lowest proximity among those closer than the stick factor threshold
+        best_proximity = None
+        best_axis = None
+        for axis, cos, sin in snap_axis:
+            proximity = abs(cos * a + sin * b)
+            if proximity <= stick_factor and (best_proximity is None or proximity < best_proximity):
+                best_proximity, best_axis = proximity, axis
 
-            is_on_rot_axis = abs(proximity) <= stick_factor
-            if is_on_rot_axis:
-                elegible_axis.append((abs(proximity), axis))
-
-        # Get the elegible axis with the lowest proximity
-        if elegible_axis:
-            proximity, axis = sorted(elegible_axis)[0]
-        else:
-            pass
+        if best_axis is not None:
+            axis = best_axis
+        elif tool_state.lock_axis:
+            axis = tool_state.snap_angle
 
         # If lock axis is on it will use the snap angle so there is no need to search for elegible axis
-        if elegible_axis or tool_state.lock_axis:
-            rot_mat = Matrix.Rotation(math.radians(360 - axis), 3, pivot_axis)
+        if best_axis is not None or tool_state.lock_axis:
+            if rotation := SNAP_AXIS_MATRICES.get((axis, pivot_axis)):
+                rot_mat, rot_mat_inv = rotation
+            else:
+                rot_mat = Matrix.Rotation(math.radians(360 - axis), 3, pivot_axis)
+                rot_mat_inv = rot_mat.inverted()
             rot_intersection = rot_mat @ translated_intersection
-            start, end = create_axis_line_data(rot_mat, last_point)
+            start, end = create_axis_line_data(rot_mat_inv, last_point)
             PolylineDecorator.set_angle_axis_line(start, end)
 
             # Snap to axis
@@ -235,7 +220,7 @@ class Snap(bonsai.core.tool.Snap):
             if tool_state.plane_method == "XZ":
                 rot_intersection = Vector((rot_intersection.x, rot_intersection.y, 0))
             # Convert it back
-            snap_intersection = rot_mat.inverted() @ rot_intersection + last_point
+            snap_intersection = rot_mat_inv @ rot_intersection + last_point
             return snap_intersection, axis, start, end
 
         return None, None, None, None
@@ -244,11 +229,17 @@ class Snap(bonsai.core.tool.Snap):
     def mix_snap_and_axis(cls, snap_point, axis_start, axis_end):
         # Creates a mixed snap point between the locked axis and the object snap
         # Then it sorts them to get the shortest first
+        # Intersecting the axis with the X, Y and Z aligned planes through the snap point is
+        # the same as solving the axis line equation for each coordinate of the snap point
+        direction = axis_end - axis_start
+        offset = snap_point[0] - axis_start
         intersections = []
-        intersections.append(tool.Cad.intersect_edge_plane(axis_start, axis_end, snap_point[0], Vector((1, 0, 0))))
-        intersections.append(tool.Cad.intersect_edge_plane(axis_start, axis_end, snap_point[0], Vector((0, 1, 0))))
-        intersections.append(tool.Cad.intersect_edge_plane(axis_start, axis_end, snap_point[0], Vector((0, 0, 1))))
-        sorted_intersections = sorted(((i, "Mix") for i in intersections if i is not None), reverse=False)
+        for i in range(3):
+            # Same parallel check as mathutils.geometry.intersect_line_plane
+            if abs(direction[i]) > FLT_EPSILON:
+                intersections.append(axis_start + direction * (offset[i] / direction[i]))
+        # Vectors are compared by their length
+        sorted_intersections = sorted((i, "Mix") for i in intersections)
         return sorted_intersections
 
     @classmethod
@@ -271,6 +262,7 @@ class Snap(bonsai.core.tool.Snap):
             (0, -offset),
             (offset, -offset),
         )
+        offset_mouse_positions = [(mouse_pos[0] + dx, mouse_pos[1] + dy) for dx, dy in mouse_offset]
 
         # TODO Snap like Blender snap increment. Enable this when we have a proper snap settings.
         # Still need adjustments to improve the feel
@@ -318,33 +310,49 @@ class Snap(bonsai.core.tool.Snap):
 
             return plane_origin, plane_normal
 
-        def cast_rays_to_single_object(obj, mouse_pos):
+        def cast_rays_to_single_object(obj):
             if obj.type != "MESH":
                 return None, None, None
             hit, normal, face_index = tool.Raycast.obj_ray_cast(context, event, obj)
             if hit is None:
                 # Tried original mouse position. Now it will try the offsets.
-                original_mouse_pos = mouse_pos
-                for value in mouse_offset:
-                    mouse_pos = tuple(x + y for x, y in zip(original_mouse_pos, value))
-                    hit, normal, face_index = tool.Raycast.obj_ray_cast(context, event, obj, mouse_pos)
+                for offset_mouse_pos in offset_mouse_positions:
+                    hit, normal, face_index = tool.Raycast.obj_ray_cast(context, event, obj, offset_mouse_pos)
                     if hit:
                         break
-                mouse_pos = original_mouse_pos
             if hit:
                 hit_world = obj.original.matrix_world @ hit
                 return obj, hit_world, face_index
             else:
                 return None, None, None
 
-        def cast_rays_and_get_best_object(objs_to_raycast, mouse_pos):
+        def get_min_hit_length_squared(obj):
+            # Any hit lies within the object bounding sphere, so it can't be closer to the ray origin than this.
+            # The sphere comes from the opposite local bound box corners, only its center is transformed
+            # and the radius is scaled by the Frobenius norm, which is never less than the matrix stretch.
+            matrix = obj.matrix_world
+            bbox_min, bbox_max = Vector(obj.bound_box[0]), Vector(obj.bound_box[6])
+            center = matrix @ ((bbox_min + bbox_max) / 2)
+            scale = sum(value * value for row in matrix.to_3x3() for value in row) ** 0.5
+            radius = (bbox_max - bbox_min).length / 2 * scale
+            min_length = max((center - ray_origin).length - radius, 0.0)
+            return min_length * min_length
+
+        def cast_rays_and_get_best_object(objs_to_raycast):
             best_length_squared = 1.0
             best_obj = None
             best_hit = None
             best_face_index = None
 
-            for obj in objs_to_raycast:
-                snap_obj, hit, face_index = cast_rays_to_single_object(obj, mouse_pos)
+            # Raycast front to back, so we can stop once no other object can be hit any closer.
+            candidates = sorted(
+                ((get_min_hit_length_squared(obj), obj) for obj in objs_to_raycast if obj.type == "MESH"),
+                key=lambda candidate: candidate[0],
+            )
+            for min_length_squared, obj in candidates:
+                if best_obj is not None and best_length_squared <= min_length_squared:
+                    break
+                snap_obj, hit, face_index = cast_rays_to_single_object(obj)
 
                 if hit is not None:
                     length_squared = (hit - ray_origin).length_squared
@@ -416,8 +424,11 @@ class Snap(bonsai.core.tool.Snap):
                             }
                         )
             if obj.type == "CURVE":
-                new_object = bpy.data.objects.new("new_object", obj.to_mesh().copy())
-                snap_points = tool.Raycast.ray_cast_by_proximity(context, event, new_object)
+                # Use a temporary bmesh rather than adding a new object and mesh to bpy.data on every event.
+                bm = bmesh.new()
+                bm.from_mesh(obj.to_mesh())
+                obj.to_mesh_clear()
+                snap_points = tool.Raycast.ray_cast_by_proximity(context, event, obj, custom_bmesh=bm)
                 if snap_points:
                     detected_snaps.append(
                         {
@@ -439,7 +450,7 @@ class Snap(bonsai.core.tool.Snap):
             space.shading.type == "WIREFRAME" and space.shading.show_xray_wireframe
         ):
             for obj in objs_to_raycast:
-                snap_obj, hit, face_index = cast_rays_to_single_object(obj, mouse_pos)
+                snap_obj, hit, face_index = cast_rays_to_single_object(obj)
                 if hit is not None:
                     snap_point = {
                         "point": hit,
@@ -449,7 +460,7 @@ class Snap(bonsai.core.tool.Snap):
                     }
                     detected_snaps.append(snap_point)
         else:
-            snap_obj, hit, face_index = cast_rays_and_get_best_object(objs_to_raycast, mouse_pos)
+            snap_obj, hit, face_index = cast_rays_and_get_best_object(objs_to_raycast)
             if hit is not None:
                 snap_point = {
                     "point": hit,
@@ -517,55 +528,64 @@ class Snap(bonsai.core.tool.Snap):
 
         return detected_snaps
 
+    @classmethod
+    @lru_cache
+    def get_snap_setting_names(cls, props_type: type[bpy.types.PropertyGroup]) -> tuple[tuple[str, str], ...]:
+        """Get pairs of snap setting property identifiers and their UI names, which match snap types."""
+        properties = props_type.bl_rna.properties
+        return tuple((prop, properties[prop].name) for prop in props_type.__annotations__.keys())
+
     @classmethod
     def select_snapping_points(cls, context, event, tool_state, detected_snaps):
         def filter_snapping_points_based_on_settings(snapping_points):
-            options = ["Plane", "Axis"]
+            options = {"Plane", "Axis"}
             props = context.scene.BIMSnapProperties
-            for prop in props.__annotations__.keys():
-                if getattr(props, prop):
-                    options.append(props.rna_type.properties[prop].name)
+            options.update(name for prop, name in cls.get_snap_setting_names(type(props)) if getattr(props, prop))
 
             filtered_points = [point for point in snapping_points if point[1] in options]
             return filtered_points
 
         def filter_snapping_groups_based_on_settings(detected_snaps):
-            options = ["Edge-Vertex", "Axis", "Plane"]
+            options = {"Edge-Vertex", "Axis", "Plane"}
             props = context.scene.BIMSnapGroups
-            for prop in props.__annotations__.keys():
-                if getattr(props, prop):
-                    options.append(props.rna_type.properties[prop].name)
+            options.update(name for prop, name in cls.get_snap_setting_names(type(props)) if getattr(props, prop))
             filtered_groups = [group for group in detected_snaps if group["group"] in options]
             return filtered_groups
 
         filtered_snaps = filter_snapping_groups_based_on_settings(detected_snaps)
         snapping_points = []
         edges = []  # Get edges to create edge-intersection snap
+        # Axis and Plane groups are always collected. Of the other groups, points are only taken up to
+        # and including the first Polyline, Measure or Object group.
+        is_last_group_found = False
         for snap_group in filtered_snaps:
-            snap_obj = None
-            if snap_group["group"] == "Polyline":
+            group = snap_group["group"]
+            if group == "Axis":
+                axis_start = snap_group["axis_start"]
+                axis_end = snap_group["axis_end"]
+                snapping_points.append((snap_group["point"], "Axis", None))
+            elif group == "Plane":
+                snapping_points.append((snap_group["point"], "Plane", None))
+            elif is_last_group_found:
+                continue
+            elif group == "Polyline":
                 for p in snap_group["points"]:
                     snapping_points.append((p["point"], p["type"], None))
-                break
-            if snap_group["group"] == "Measure":
+                is_last_group_found = True
+            elif group == "Measure":
                 for p in snap_group["points"]:
                     snapping_points.append((p["point"], p["type"], None))
                     if p["type"] == "Edge":
                         edges.append(p)
-                break
-            if snap_group["group"] == "Edge-Vertex":
+                is_last_group_found = True
+            elif group == "Edge-Vertex":
                 for p in snap_group["points"]:
                     snapping_points.append((p["point"], p["type"], snap_group["object"]))
                     if p["type"] == "Edge":
                         edges.append(p)
-
-            if snap_group["group"] == "Object":
+            elif group == "Object":
                 obj = snap_group["object"]
-                matrix = obj.matrix_world.copy()
                 face = obj.data.polygons[snap_group["face_index"]]
-                verts = []
-                for i in face.vertices:
-                    verts.append(matrix @ obj.data.vertices[i].co)
                 snap_points = tool.Raycast.ray_cast_by_proximity(context, event, obj, face)
                 if not snap_points:
                     snapping_points.append((snap_group["point"], "Face", obj))
@@ -574,16 +594,7 @@ class Snap(bonsai.core.tool.Snap):
                         snapping_points.append((p["point"], p["type"], obj))
                         if p["type"] == "Edge":
                             edges.append(p)
-                break
-
-        for snap_group in filtered_snaps:
-            if snap_group["group"] == "Axis":
-                axis_start = snap_group["axis_start"]
-                axis_end = snap_group["axis_end"]
-                snapping_points.append((snap_group["point"], "Axis", snap_obj))
-
-            if snap_group["group"] == "Plane":
-                snapping_points.append((snap_group["point"], "Plane", snap_obj))
+                is_last_group_found = True
 
         # Edges intersection snap
         if edges:
@@ -155,3 +155,23 @@ class Structural(bonsai.core.tool.Structural):
             new = props.structural_analysis_models.add()
             new.ifc_definition_id = ifc_definition_id
             new.name = model["Name"] or "Unnamed"
+
+    @classmethod
+    def update_structural_analysis_model(cls, model: ifcopenshell.entity_instance) -> None:
+        props = bpy.context.scene.BIMStructuralProperties
+        model_id = model.id()
+        for item in props.structural_analysis_models:
+            if item.ifc_definition_id == model_id:
+                item.name = model.Name or "Unnamed"
+                return
+
+    @classmethod
+    def unload_structural_analysis_model(cls, model: int) -> None:
+        props = bpy.context.scene.BIMStructuralProperties
+        for i, item in enumerate(props.structural_analysis_models):
+            if item.ifc_definition_id == model:
+                props.structural_analysis_models.remove(i)
+                break
+        props.active_structural_analysis_model_index = min(
+            props.active_structural_analysis_model_index, max(len(props.structural_analysis_models) - 1, 0)
+        )
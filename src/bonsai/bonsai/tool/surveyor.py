@@ -26,11 +26,12 @@ import numpy as np
 import numpy.typing as npt
 from mathutils import Matrix
 
+M_TRANSLATION = (slice(0, 3), 3)
+
 
 class Surveyor(bonsai.core.tool.Surveyor):
     @classmethod
     def get_absolute_matrix(cls, obj: bpy.types.Object) -> npt.NDArray[np.float64]:
-        M_TRANSLATION = (slice(0, 3), 3)
         matrix = np.array(obj.matrix_world)
         props = bpy.context.scene.BIMGeoreferenceProperties
         if props.has_blender_offset and obj.BIMObjectProperties.blender_offset_type != "NOT_APPLICABLE":
@@ -38,14 +39,13 @@ class Surveyor(bonsai.core.tool.Surveyor):
             coordinate_offset = tool.Geometry.get_cartesian_point_offset(obj)
             if coordinate_offset is not None:
                 matrix[M_TRANSLATION] -= coordinate_offset
-            matrix = np.array(
-                ifcopenshell.util.geolocation.local2global(
-                    matrix,
-                    float(props.blender_offset_x) * unit_scale,
-                    float(props.blender_offset_y) * unit_scale,
-                    float(props.blender_offset_z) * unit_scale,
-                    float(props.blender_x_axis_abscissa),
-                    float(props.blender_x_axis_ordinate),
-                )
+            # local2global returns a new ndarray for an ndarray input, no need to copy it again.
+            matrix = ifcopenshell.util.geolocation.local2global(
+                matrix,
+                float(props.blender_offset_x) * unit_scale,
+                float(props.blender_offset_y) * unit_scale,
+                float(props.blender_offset_z) * unit_scale,
+                float(props.blender_x_axis_abscissa),
+                float(props.blender_x_axis_ordinate),
             )
         return matrix
@@ -24,6 +24,7 @@ class TestCopyAttributeToSelection:
     def test_run(self, ifc, blender, root, spatial):
         blender.get_selected_objects(include_active=False).should_be_called().will_return(["obj"])
         ifc.get_entity("obj").should_be_called().will_return("element")
+        root.has_attribute("element", "name").should_be_called().will_return(True)
         ifc.run("attribute.edit_attributes", product="element", attributes={"name": "value"}).should_be_called()
         assert subject.copy_attribute_to_selection(ifc, blender, root, spatial, name="name", value="value") == 1
 
@@ -32,9 +33,16 @@ class TestCopyAttributeToSelection:
         ifc.get_entity("obj").should_be_called().will_return(None)
         assert subject.copy_attribute_to_selection(ifc, blender, root, spatial, name="name", value="value") == 0
 
+    def test_do_nothing_if_element_has_no_such_attribute(self, ifc, blender, root, spatial):
+        blender.get_selected_objects(include_active=False).should_be_called().will_return(["obj"])
+        ifc.get_entity("obj").should_be_called().will_return("element")
+        root.has_attribute("element", "name").should_be_called().will_return(False)
+        assert subject.copy_attribute_to_selection(ifc, blender, root, spatial, name="name", value="value") == 0
+
     def test_changing_object_name_in_blender_if_attribute_changed(self, ifc, blender, root, spatial):
         blender.get_selected_objects(include_active=False).should_be_called().will_return(["obj"])
         ifc.get_entity("obj").should_be_called().will_return("element")
+        root.has_attribute("element", "Name").should_be_called().will_return(True)
         ifc.run("attribute.edit_attributes", product="element", attributes={"Name": "value"}).should_be_called()
         root.set_object_name("obj", "element").should_be_called()
         root.is_spatial_element("element").should_be_called().will_return(False)
@@ -43,6 +51,7 @@ class TestCopyAttributeToSelection:
     def test_refreshing_spatial_decomposition_if_identification_changed(self, ifc, blender, root, spatial):
         blender.get_selected_objects(include_active=False).should_be_called().will_return(["obj"])
         ifc.get_entity("obj").should_be_called().will_return("element")
+        root.has_attribute("element", "Name").should_be_called().will_return(True)
         ifc.run("attribute.edit_attributes", product="element", attributes={"Name": "value"}).should_be_called()
         root.set_object_name("obj", "element").should_be_called()
         root.is_spatial_element("element").should_be_called().will_return(True)
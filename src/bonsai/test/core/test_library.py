@@ -119,8 +119,34 @@ class TestAssignLibraryReference:
         subject.assign_library_reference(ifc, obj="obj", reference="reference")
 
 
+class TestAssignLibraryReferences:
+    def test_run(self, ifc):
+        ifc.get_entity("obj1").should_be_called().will_return("product1")
+        ifc.get_entity("obj2").should_be_called().will_return("product2")
+        ifc.run("library.assign_reference", products=["product1", "product2"], reference="reference").should_be_called()
+        subject.assign_library_references(ifc, objs=["obj1", "obj2"], reference="reference")
+
+    def test_skipping_objects_that_are_not_elements(self, ifc):
+        ifc.get_entity("obj").should_be_called().will_return(None)
+        subject.assign_library_references(ifc, objs=["obj"], reference="reference")
+
+
 class TestUnassignLibraryReference:
     def test_run(self, ifc):
         ifc.get_entity("obj").should_be_called().will_return("product")
         ifc.run("library.unassign_reference", products=["product"], reference="reference").should_be_called()
         subject.unassign_library_reference(ifc, obj="obj", reference="reference")
+
+
+class TestUnassignLibraryReferences:
+    def test_run(self, ifc):
+        ifc.get_entity("obj1").should_be_called().will_return("product1")
+        ifc.get_entity("obj2").should_be_called().will_return("product2")
+        ifc.run(
+            "library.unassign_reference", products=["product1", "product2"], reference="reference"
+        ).should_be_called()
+        subject.unassign_library_references(ifc, objs=["obj1", "obj2"], reference="reference")
+
+    def test_skipping_objects_that_are_not_elements(self, ifc):
+        ifc.get_entity("obj").should_be_called().will_return(None)
+        subject.unassign_library_references(ifc, objs=["obj"], reference="reference")
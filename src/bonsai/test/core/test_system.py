@@ -78,12 +78,24 @@ class TestAssignSystem:
         subject.assign_system(ifc, system="system", product="product")
 
 
+class TestAssignSystems:
+    def test_run(self, ifc):
+        ifc.run("system.assign_system", products=["product", "product2"], system="system").should_be_called()
+        subject.assign_systems(ifc, system="system", products=["product", "product2"])
+
+
 class TestUnassignSystem:
     def test_run(self, ifc):
         ifc.run("system.unassign_system", products=["product"], system="system").should_be_called()
         subject.unassign_system(ifc, system="system", product="product")
 
 
+class TestUnassignSystems:
+    def test_run(self, ifc):
+        ifc.run("system.unassign_system", products=["product", "product2"], system="system").should_be_called()
+        subject.unassign_systems(ifc, system="system", products=["product", "product2"])
+
+
 class TestSelectSystemProducts:
     def test_run(self, system):
         system.select_system_products("system").should_be_called()
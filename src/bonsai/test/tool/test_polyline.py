@@ -17,6 +17,7 @@
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import pytest
 import ifcopenshell
 import bonsai.core.tool
 import bonsai.tool as tool
@@ -30,25 +31,39 @@ class TestImplementsTool(NewFile):
 
 
 class TestValidateInput(NewFile):
-    def test_simple_units(self):
+    @pytest.mark.parametrize(
+        "prefix, input_value, input_type, expected",
+        [
+            (None, "25", "D", "25.0"),
+            ("MILLI", "25", "D", "0.025"),
+            # Angle.
+            ("MILLI", "25", "A", "25.0"),
+        ],
+    )
+    def test_metric_units(self, prefix, input_value, input_type, expected):
         ifc = ifcopenshell.api.project.create_file()
         tool.Ifc.set(ifc)
         ifcopenshell.api.root.create_entity(ifc, ifc_class="IfcProject")
-        unit = ifcopenshell.api.unit.add_si_unit(ifc, unit_type="LENGTHUNIT", prefix=None)
+        unit = ifcopenshell.api.unit.add_si_unit(ifc, unit_type="LENGTHUNIT", prefix=prefix)
         ifcopenshell.api.unit.assign_unit(ifc, [unit])
-        unit_settings = bpy.context.scene.unit_settings
-        unit_settings.system = "METRIC"
-        assert subject.validate_input("25", "D") == (True, "25.0")
-        unit.Prefix = "MILLI"
-        unit_settings.length_unit = "MILLIMETERS"
-        assert subject.validate_input("25", "D") == (True, "0.025")
+        bpy.context.scene.unit_settings.system = "METRIC"
+        assert subject.validate_input(input_value, input_type) == (True, expected)
 
-        unit_settings.system = "IMPERIAL"
+    @pytest.mark.parametrize(
+        "input_value, input_type, expected",
+        [
+            ("25", "D", "7.62"),
+            ("25'", "D", "7.62"),
+            ('25"', "D", "0.635"),
+            # Angle.
+            ("25", "A", "25.0"),
+        ],
+    )
+    def test_imperial_units(self, input_value, input_type, expected):
+        ifc = ifcopenshell.api.project.create_file()
+        tool.Ifc.set(ifc)
+        ifcopenshell.api.root.create_entity(ifc, ifc_class="IfcProject")
         unit = ifcopenshell.api.unit.add_conversion_based_unit(ifc, name="foot")
         ifcopenshell.api.unit.assign_unit(ifc, [unit])
-        assert subject.validate_input("25", "D") == (True, "7.62")
-        assert subject.validate_input("25'", "D") == (True, "7.62")
-        assert subject.validate_input('25"', "D") == (True, "0.635")
-
-        # Angle.
-        assert subject.validate_input("25", "A") == (True, "25.0")
+        bpy.context.scene.unit_settings.system = "IMPERIAL"
+        assert subject.validate_input(input_value, input_type) == (True, expected)
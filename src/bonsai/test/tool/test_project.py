@@ -17,12 +17,12 @@
 # along with Bonsai.  If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import pytest
 import ifcopenshell
 import ifcopenshell.api.document
 import ifcopenshell.api.root
 import bonsai.core.tool
 import bonsai.tool as tool
-import tempfile
 from test.bim.bootstrap import NewFile
 from bonsai.tool.project import Project as subject
 from pathlib import Path
@@ -135,69 +135,52 @@ class TestSetDefaultModelingDimensions(NewFile):
         assert props.z == 0.5
 
 
-class PreserveFileContents:
-    original_content: str
-    filepath: Path
-
-    def __init__(self, filepath: Path):
-        self.filepath = filepath
-
-    def __enter__(self):
-        if not self.filepath.exists():
-            self.filepath.parent.mkdir(parents=True, exist_ok=True)
-            open(self.filepath, "w").close()  # touch.
-
-        with open(self.filepath, "r") as file:
-            self.original_content = file.read()
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        with open(self.filepath, "w") as file:
-            file.write(self.original_content)
+@pytest.fixture
+def recent_ifc_projects_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    filepath = tmp_path / "recent-ifc-projects.txt"
+    monkeypatch.setattr(subject, "get_recent_ifc_projects_path", lambda: filepath)
+    # Don't leak recent projects cached during the test.
+    monkeypatch.setattr(subject, "_recent_ifc_projects_loaded", False)
+    monkeypatch.setattr(subject, "_recent_ifc_projects", [])
+    return filepath
 
 
 class TestRecentIFCProjects(NewFile):
     def test_get_recent_ifc_projects_path(self):
         assert subject.get_recent_ifc_projects_path().name == "recent-ifc-projects.txt"
 
-    def test_clear_recent_ifc_projects(self):
-        filepath = subject.get_recent_ifc_projects_path()
-        with PreserveFileContents(filepath):
-            with open(filepath, "w") as fo:
-                fo.write(tempfile.NamedTemporaryFile(suffix=".ifc").name)
-
-            assert filepath.stat().st_size != 0
-            subject.clear_recent_ifc_projects()
-            assert filepath.stat().st_size == 0
-
-    def test_get_write_recent_ifc_projects(self):
-        filepath = subject.get_recent_ifc_projects_path()
-        with PreserveFileContents(filepath):
-            subject.clear_recent_ifc_projects()
-            assert filepath.stat().st_size == 0
-
-            projects: list[Path] = []
-            for _ in range(3):
-                ifc_file = Path(tempfile.NamedTemporaryFile(suffix=".ifc").name)
-                open(ifc_file, "w").close()
-                projects.append(ifc_file)
-
-            subject.write_recent_ifc_projects(projects)
-            assert filepath.stat().st_size != 0
-            assert subject.get_recent_ifc_projects() == projects
-            with open(filepath) as fi:
-                contents = fi.read()
-            assert contents == "\n".join(str(p) for p in projects)
-
-    def test_add_recent_ifc_project(self):
-        filepath = subject.get_recent_ifc_projects_path()
-        with PreserveFileContents(filepath):
-            subject.clear_recent_ifc_projects()
-            assert filepath.stat().st_size == 0
-            ifc_file = Path(tempfile.NamedTemporaryFile(suffix=".ifc").name)
-            subject.add_recent_ifc_project(ifc_file)
-            assert filepath.stat().st_size != 0
-            assert subject.get_recent_ifc_projects() == [ifc_file]
+    def test_clear_recent_ifc_projects(self, recent_ifc_projects_path: Path, tmp_path: Path):
+        filepath = recent_ifc_projects_path
+        with open(filepath, "w") as fo:
+            fo.write(str(tmp_path / "project.ifc"))
+
+        assert filepath.stat().st_size != 0
+        subject.clear_recent_ifc_projects()
+        assert filepath.stat().st_size == 0
+
+    def test_get_write_recent_ifc_projects(self, recent_ifc_projects_path: Path, tmp_path: Path):
+        filepath = recent_ifc_projects_path
+        subject.clear_recent_ifc_projects()
+        assert filepath.stat().st_size == 0
+
+        # Recent projects are stored as paths only, the files don't need to exist.
+        projects = [tmp_path / f"project{i}.ifc" for i in range(3)]
+
+        subject.write_recent_ifc_projects(projects)
+        assert filepath.stat().st_size != 0
+        assert subject.get_recent_ifc_projects() == projects
+        with open(filepath) as fi:
+            contents = fi.read()
+        assert contents == "\n".join(str(p) for p in projects)
+
+    def test_add_recent_ifc_project(self, recent_ifc_projects_path: Path, tmp_path: Path):
+        filepath = recent_ifc_projects_path
+        subject.clear_recent_ifc_projects()
+        assert filepath.stat().st_size == 0
+        ifc_file = tmp_path / "project.ifc"
+        subject.add_recent_ifc_project(ifc_file)
+        assert filepath.stat().st_size != 0
+        assert subject.get_recent_ifc_projects() == [ifc_file]
 
 
 class TestLoadProject(NewFile):
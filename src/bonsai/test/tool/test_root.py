@@ -134,6 +134,13 @@ class TestGetRepresentationContext(NewFile):
         assert subject.get_representation_context(representation) == context
 
 
+class TestHasAttribute(NewFile):
+    def test_run(self):
+        ifc = ifcopenshell.file()
+        assert subject.has_attribute(ifc.createIfcWall(), "Name") is True
+        assert subject.has_attribute(ifc.createIfcWall(), "LongName") is False
+
+
 class TestIsElementA(NewFile):
     def test_run(self):
         ifc = ifcopenshell.file()
@@ -72,38 +72,50 @@ def add_boolean(
     original_first_item = first_item
 
     second_items = [i for i in second_items if i != first_item and is_operand(i)]
+    if not second_items:
+        return []
+    # Operands already combined with the first item, tracked as a set for cheap lookups.
+    existing_operands = set()
 
+    # Walk up to the top of any boolean chain the first item is part of. The
+    # inverses of the last item visited are kept for replacing it below.
     while True:
-        is_part_of_boolean = False
-        for inverse in file.get_inverse(first_item):
-            if inverse.is_a("IfcBooleanResult"):
-                is_part_of_boolean = True
-                first_item = inverse
-                if inverse.FirstOperand == original_first_item and inverse.SecondOperand in second_items:
-                    second_items.remove(inverse.SecondOperand)
-                elif inverse.SecondOperand == original_first_item and inverse.FirstOperand in second_items:
-                    second_items.remove(inverse.FirstOperand)
-                break
-        if not is_part_of_boolean:
+        inverses = file.get_inverse(first_item)
+        boolean = next((i for i in inverses if i.is_a("IfcBooleanResult")), None)
+        if boolean is None:
             break
+        first_item = boolean
+        if boolean.FirstOperand == original_first_item:
+            existing_operands.add(boolean.SecondOperand)
+        elif boolean.SecondOperand == original_first_item:
+            existing_operands.add(boolean.FirstOperand)
+
+    if existing_operands:
+        second_items = [i for i in second_items if i not in existing_operands]
 
     if not second_items:
         return []
 
     # Don't replace style or aspect relationships.
-    to_replace = set(
-        [i for i in file.get_inverse(first_item) if i.is_a("IfcShapeRepresentation") or i.is_a("IfcBooleanResult")]
-    )
+    to_replace = {i for i in inverses if i.is_a("IfcShapeRepresentation") or i.is_a("IfcBooleanResult")}
 
     first = first_item
 
-    booleans = []
+    # Second items stop being top level items, rewriting each representation once.
+    removed_items: dict[ifcopenshell.entity_instance, set[ifcopenshell.entity_instance]] = {}
     for second_item in second_items:
         for inverse in file.get_inverse(second_item):
             if inverse.is_a("IfcShapeRepresentation"):
-                inverse.Items = list(set(inverse.Items) - {second_item})
-        if first.is_a("IfcTesselatedFaceSet"):
-            first.Closed = True  # For now, trust the user to do the right thing.
+                removed_items.setdefault(inverse, set()).add(second_item)
+    for representation, items in removed_items.items():
+        representation.Items = [i for i in representation.Items if i not in items]
+
+    # Only the item the first operation is performed upon can be a face set, later ones are boolean results.
+    if first.is_a("IfcTesselatedFaceSet"):
+        first.Closed = True  # For now, trust the user to do the right thing.
+
+    booleans = []
+    for second_item in second_items:
         if second_item.is_a("IfcTesselatedFaceSet"):
             second_item.Closed = True  # For now, trust the user to do the right thing.
         if (
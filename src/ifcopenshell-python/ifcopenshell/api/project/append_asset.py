@@ -17,7 +17,6 @@
 # along with IfcOpenShell.  If not, see <http://www.gnu.org/licenses/>.
 
 import ifcopenshell
-import ifcopenshell.ifcopenshell_wrapper as W
 import ifcopenshell.api.geometry
 import ifcopenshell.api.type
 import ifcopenshell.api.project
@@ -27,8 +26,9 @@ import ifcopenshell.util.element
 import ifcopenshell.util.geolocation
 import ifcopenshell.util.placement
 import ifcopenshell.util.unit
+import numpy as np
+from collections import deque
 from typing import Optional, Any, Union, Literal, get_args, Callable
-from functools import partial
 
 
 APPENDABLE_ASSET = Literal[
@@ -154,18 +154,16 @@ class SafeRemovalContext:
         ifcopenshell.util.element.batch_remove_deep2(self.file)
 
     def __exit__(self, *args):
-        original_identities: dict[ifcopenshell.entity_instance, int] = {}
-        assert self.file.to_delete is not None
-        elements = self.file.to_delete
-        for identity, element in self.reuse_identities.items():
-            if element in elements:
-                original_identities[element] = identity
-        assert len(original_identities) == len(elements)
+        to_delete = self.file.to_delete
+        assert to_delete is not None
+        original_identities: dict[ifcopenshell.entity_instance, int] = {
+            element: identity for identity, element in self.reuse_identities.items() if element in to_delete
+        }
+        assert len(original_identities) == len(to_delete)
 
         # Actually remove elements.
-        for element in self.file.to_delete:
-            if element in self.file.to_delete:
-                self.file.remove(element)
+        for element in to_delete:
+            self.file.remove(element)
         self.file.to_delete = None
 
         # Clean up dead identities.
@@ -178,12 +176,33 @@ class Usecase:
     settings: dict[str, Any]
     assume_asset_uniqueness_by_name: bool
     whitelisted_inverse_attributes: dict[str, list[str]]
+    whitelisted_inverse_attributes_by_class: dict[str, list[tuple[str, Optional[str]]]]
+    name_indexes: dict[str, dict[Optional[str], ifcopenshell.entity_instance]]
+    guids: dict[str, Union[ifcopenshell.entity_instance, None]]
+    existing_contexts_index: Union[dict[tuple, ifcopenshell.entity_instance], None]
+    asset_classes: dict[str, bool]
+    conversion_factor: Optional[float]
+    length_measure_attributes: dict[str, tuple[bool, ...]]
 
     def execute(self):
         # mapping of old element ids to new elements
         self.added_elements: dict[int, ifcopenshell.entity_instance] = {}
+        # ifc class -> {name: first existing element with that name}, populated lazily
+        self.name_indexes = {}
+        # GlobalId -> project element, or None if it's known to be missing
+        self.guids = {}
+        # Equivalence key -> first matching context from existing_contexts, populated lazily
+        self.existing_contexts_index = None
+        # ifc class -> whether its elements are treated as assets of target_class, populated lazily
+        self.asset_classes = {}
+        # Library to project length conversion, calculated on first use.
+        self.conversion_factor = None
+        # ifc class -> whether each attribute is an IfcLengthMeasure
+        self.length_measure_attributes = {}
         self.reuse_identities: dict[int, ifcopenshell.entity_instance] = self.settings["reuse_identities"]
         self.whitelisted_inverse_attributes = {}
+        # ifc class -> applicable (attribute, attribute_class) pairs, populated lazily
+        self.whitelisted_inverse_attributes_by_class = {}
         self.base_material_class = "IfcMaterial" if self.file.schema == "IFC2X3" else "IfcMaterialDefinition"
         self.assume_asset_uniqueness_by_name = self.settings["assume_asset_uniqueness_by_name"]
 
@@ -207,10 +226,28 @@ class Usecase:
             return self.append_presentation_style()
 
     def by_guid(self, guid: str) -> Union[ifcopenshell.entity_instance, None]:
+        if guid in self.guids:
+            return self.guids[guid]
         try:
-            return self.file.by_guid(guid)
+            element = self.file.by_guid(guid)
         except RuntimeError:
-            return None
+            element = None
+        self.guids[guid] = element
+        return element
+
+    def get_name_index(self, ifc_class: str) -> dict[Optional[str], ifcopenshell.entity_instance]:
+        if (index := self.name_indexes.get(ifc_class)) is None:
+            name_attribute = "ProfileName" if ifc_class == "IfcProfileDef" else "Name"
+            index = self.name_indexes[ifc_class] = {}
+            for e in self.file.by_type(ifc_class):
+                # Keep the first match, same as scanning by_type.
+                index.setdefault(getattr(e, name_attribute), e)
+        return index
+
+    def add_to_name_indexes(self, element: ifcopenshell.entity_instance) -> None:
+        for ifc_class, index in self.name_indexes.items():
+            if element.is_a(ifc_class):
+                index.setdefault(element.ProfileName if ifc_class == "IfcProfileDef" else element.Name, element)
 
     def get_existing_element(self, element: ifcopenshell.entity_instance) -> Union[ifcopenshell.entity_instance, None]:
         if element.id() in self.added_elements:
@@ -220,16 +257,14 @@ class Usecase:
         elif not self.assume_asset_uniqueness_by_name:
             return None
         elif element.is_a("IfcMaterial"):
-            name = element.Name
-            return next((e for e in self.file.by_type("IfcMaterial") if e.Name == name), None)
+            return self.get_name_index("IfcMaterial").get(element.Name)
         elif element.is_a("IfcProfileDef"):
             profile_name = element.ProfileName
             if profile_name is None:
                 return None
-            return next((e for e in self.file.by_type("IfcProfileDef") if e.ProfileName == profile_name), None)
+            return self.get_name_index("IfcProfileDef").get(profile_name)
         elif element.is_a("IfcPresentationStyle"):
-            name = element.Name
-            return next((e for e in self.file.by_type("IfcPresentationStyle") if e.Name == name), None)
+            return self.get_name_index("IfcPresentationStyle").get(element.Name)
         else:
             return None
 
@@ -320,9 +355,12 @@ class Usecase:
         new = self.file_add(element)
         self.added_elements[element.id()] = new
         self.check_inverses(element)
-        subelement_queue = self.settings["library"].traverse(element, max_levels=1)[1:]
+        subelement_queue = deque(self.settings["library"].traverse(element, max_levels=1)[1:])
         while subelement_queue:
-            subelement = subelement_queue.pop(0)
+            subelement = subelement_queue.popleft()
+            if subelement.id() in self.added_elements:
+                # Already visited, e.g. a material shared by several layers.
+                continue
             existing_element = self.get_existing_element(subelement)
             if existing_element:
                 self.added_elements[subelement.id()] = existing_element
@@ -334,36 +372,41 @@ class Usecase:
                 subelement_queue.extend(self.settings["library"].traverse(subelement, max_levels=1)[1:])
         return new
 
+    def get_whitelisted_inverse_attributes(
+        self, element: ifcopenshell.entity_instance
+    ) -> list[tuple[str, Optional[str]]]:
+        ifc_class = element.is_a()
+        if (whitelisted := self.whitelisted_inverse_attributes_by_class.get(ifc_class)) is None:
+            whitelisted = []
+            for source_class, attributes in self.whitelisted_inverse_attributes.items():
+                if not element.is_a(source_class):
+                    continue
+                for attribute in attributes:
+                    attribute_class = None
+                    if "." in attribute:
+                        attribute, attribute_class = attribute.split(".")
+                    whitelisted.append((attribute, attribute_class))
+            self.whitelisted_inverse_attributes_by_class[ifc_class] = whitelisted
+        return whitelisted
+
     def has_whitelisted_inverses(self, element: ifcopenshell.entity_instance) -> bool:
-        for source_class, attributes in self.whitelisted_inverse_attributes.items():
-            if not element.is_a(source_class):
-                continue
-            for attribute in attributes:
-                attribute_class = None
-                if "." in attribute:
-                    attribute, attribute_class = attribute.split(".")
-                value = getattr(element, attribute, [])
-                if attribute_class:
-                    for subvalue in value:
-                        if subvalue.is_a(attribute_class):
-                            return True
-                elif value:
-                    return True
+        for attribute, attribute_class in self.get_whitelisted_inverse_attributes(element):
+            value = getattr(element, attribute, [])
+            if attribute_class:
+                for subvalue in value:
+                    if subvalue.is_a(attribute_class):
+                        return True
+            elif value:
+                return True
         return False
 
     def check_inverses(self, element: ifcopenshell.entity_instance) -> None:
-        for source_class, attributes in self.whitelisted_inverse_attributes.items():
-            if not element.is_a(source_class):
-                continue
-            for attribute in attributes:
-                attribute_class = None
-                if "." in attribute:
-                    attribute, attribute_class = attribute.split(".")
-                for inverse in getattr(element, attribute, []):
-                    if attribute_class and inverse.is_a(attribute_class):
-                        self.add_inverse_element(inverse)
-                    elif not attribute_class:
-                        self.add_inverse_element(inverse)
+        for attribute, attribute_class in self.get_whitelisted_inverse_attributes(element):
+            for inverse in getattr(element, attribute, []):
+                if attribute_class and inverse.is_a(attribute_class):
+                    self.add_inverse_element(inverse)
+                elif not attribute_class:
+                    self.add_inverse_element(inverse)
 
     def add_inverse_element(self, element: ifcopenshell.entity_instance) -> None:
         # Inverse attributes are added manually because they are basically
@@ -392,6 +435,8 @@ class Usecase:
         else:
             new = self.file.create_entity(element.is_a())
             self.reuse_identities[element_identity] = new
+            if new.is_a("IfcRoot"):
+                self.guids[element.GlobalId] = new
 
         for i, attribute in enumerate(element):
             new_attribute = None
@@ -414,7 +459,8 @@ class Usecase:
                 # e.g. not to assign a material or a pset from element.
                 if existing_rel:
                     new_attribute.extend(existing_rel[i])
-                    new_attribute = list(set(new_attribute))
+                    # Deduplicate preserving order, to keep the output deterministic.
+                    new_attribute = list(dict.fromkeys(new_attribute))
             else:
                 new_attribute = attribute
             if new_attribute is not None:
@@ -424,73 +470,114 @@ class Usecase:
         """Is IFC entity from inverse attribute is another asset to append that should be skipped."""
         if element == self.settings["element"]:
             return False
-        elif element.is_a("IfcFeatureElement"):
-            # Feature elements match the target class but aren't considered "assets"
+        elif not self.is_asset_class(element):
             return False
         elif element.is_a("IfcRoot") and self.by_guid(element.GlobalId) is not None:
             return False
-        elif element.is_a(self.target_class):
-            return True
-        elif self.target_class == "IfcProduct" and element.is_a("IfcTypeProduct"):
-            return True
-        elif self.target_class == "IfcTypeProduct" and element.is_a("IfcProduct"):
-            return True
-        return False
+        return True
+
+    def is_asset_class(self, element: ifcopenshell.entity_instance) -> bool:
+        ifc_class = element.is_a()
+        if (is_asset_class := self.asset_classes.get(ifc_class)) is None:
+            if element.is_a("IfcFeatureElement"):
+                # Feature elements match the target class but aren't considered "assets"
+                is_asset_class = False
+            elif element.is_a(self.target_class):
+                is_asset_class = True
+            elif self.target_class == "IfcProduct" and element.is_a("IfcTypeProduct"):
+                is_asset_class = True
+            elif self.target_class == "IfcTypeProduct" and element.is_a("IfcProduct"):
+                is_asset_class = True
+            else:
+                is_asset_class = False
+            self.asset_classes[ifc_class] = is_asset_class
+        return is_asset_class
 
     def reuse_existing_contexts(self) -> None:
-        added_contexts = set([e for e in self.added_elements.values() if e.is_a("IfcGeometricRepresentationContext")])
-        added_contexts -= set(self.existing_contexts)
+        added_contexts = {e for e in self.added_elements.values() if e.is_a("IfcGeometricRepresentationContext")}
+        added_contexts.difference_update(self.existing_contexts)
+        equivalent_contexts: dict[ifcopenshell.entity_instance, ifcopenshell.entity_instance] = {}
+        inverses: set[ifcopenshell.entity_instance] = set()
         for added_context in added_contexts:
             equivalent_existing_context = self.get_equivalent_existing_context(added_context)
             if not equivalent_existing_context:
                 equivalent_existing_context = self.create_equivalent_context(added_context)
-            for inverse in self.file.get_inverse(added_context):
-                ifcopenshell.util.element.replace_attribute(inverse, added_context, equivalent_existing_context)
+            equivalent_contexts[added_context] = equivalent_existing_context
+            inverses.update(self.file.get_inverse(added_context))
+
+        # Rewrite each inverse once, even if it references several added contexts.
+        is_added_context = lambda v: v in equivalent_contexts
+        get_equivalent_context = lambda v: equivalent_contexts[v]
+        for inverse in inverses:
+            for i, attribute_value in enumerate(inverse):
+                new_value = inverse.walk(is_added_context, get_equivalent_context, attribute_value)
+                if new_value != attribute_value:
+                    inverse[i] = new_value
 
         with SafeRemovalContext(self.file, self.reuse_identities):
             for added_context in added_contexts:
                 ifcopenshell.util.element.remove_deep2(self.file, added_context)
 
+    def get_context_key(self, context: ifcopenshell.entity_instance) -> tuple:
+        if context.is_a("IfcGeometricRepresentationSubContext"):
+            return (context.is_a(), context.ContextType, context.ContextIdentifier, context.TargetView)
+        return (context.is_a(), context.ContextType, context.ContextIdentifier)
+
+    def get_existing_contexts_index(self) -> dict[tuple, ifcopenshell.entity_instance]:
+        if self.existing_contexts_index is None:
+            self.existing_contexts_index = {}
+            for context in self.existing_contexts:
+                self.existing_contexts_index.setdefault(self.get_context_key(context), context)
+        return self.existing_contexts_index
+
     def get_equivalent_existing_context(
         self, added_context: ifcopenshell.entity_instance
     ) -> Union[ifcopenshell.entity_instance, None]:
-        for context in self.existing_contexts:
-            if context.is_a() != added_context.is_a():
-                continue
-            if context.is_a("IfcGeometricRepresentationSubContext"):
-                if (
-                    context.ContextType == added_context.ContextType
-                    and context.ContextIdentifier == added_context.ContextIdentifier
-                    and context.TargetView == added_context.TargetView
-                ):
-                    return context
-            elif (
-                context.ContextType == added_context.ContextType
-                and context.ContextIdentifier == added_context.ContextIdentifier
-            ):
-                return context
+        return self.get_existing_contexts_index().get(self.get_context_key(added_context))
 
     def create_equivalent_context(self, added_context: ifcopenshell.entity_instance) -> ifcopenshell.entity_instance:
         if added_context.is_a("IfcGeometricRepresentationSubContext"):
             parent = self.get_equivalent_existing_context(added_context.ParentContext)
             if not parent:
                 parent = self.create_equivalent_context(added_context.ParentContext)
-            return ifcopenshell.api.context.add_context(
+            context = ifcopenshell.api.context.add_context(
                 self.file,
                 parent=parent,
                 context_type=added_context.ContextType,
                 context_identifier=added_context.ContextIdentifier,
                 target_view=added_context.TargetView,
             )
-        return ifcopenshell.api.context.add_context(
-            self.file,
-            context_type=added_context.ContextType,
-            context_identifier=added_context.ContextIdentifier,
-        )
-
-    def file_add(
-        self, element: ifcopenshell.entity_instance, conversion_factor: Optional[float] = None
-    ) -> ifcopenshell.entity_instance:
+        else:
+            context = ifcopenshell.api.context.add_context(
+                self.file,
+                context_type=added_context.ContextType,
+                context_identifier=added_context.ContextIdentifier,
+            )
+        # Let other added contexts, e.g. subcontexts sharing a parent, reuse it.
+        self.get_existing_contexts_index()[self.get_context_key(added_context)] = context
+        return context
+
+    def get_conversion_factor(self) -> float:
+        if self.conversion_factor is None:
+            library_scale = ifcopenshell.util.unit.calculate_unit_scale(self.settings["library"])
+            current_scale = ifcopenshell.util.unit.calculate_unit_scale(self.file)
+            self.conversion_factor = library_scale / current_scale
+        return self.conversion_factor
+
+    def needs_conversion(self) -> bool:
+        return self.get_conversion_factor() != 1.0
+
+    def get_length_measure_attributes(self, element: ifcopenshell.entity_instance) -> tuple[bool, ...]:
+        ifc_class = element.is_a()
+        if (length_measure_attributes := self.length_measure_attributes.get(ifc_class)) is None:
+            attributes = element.wrapped_data.declaration().as_entity().all_attributes()
+            length_measure_attributes = tuple(
+                "<type IfcLengthMeasure: <real>>" in str(attribute.type_of_attribute()) for attribute in attributes
+            )
+            self.length_measure_attributes[ifc_class] = length_measure_attributes
+        return length_measure_attributes
+
+    def file_add(self, element: ifcopenshell.entity_instance) -> ifcopenshell.entity_instance:
         """Reimplementation of `file.add` but taking into account that some elements (profiles, materials)
         are already existing (checking by their name) and shouldn't be duplicated.
 
@@ -498,49 +585,31 @@ class Usecase:
         and there is no control to prevent it from adding certain type of elements.
         """
 
-        def get_conversion_factor() -> float:
-            nonlocal conversion_factor
-            if conversion_factor is not None:
-                return conversion_factor
-            library_scale = ifcopenshell.util.unit.calculate_unit_scale(self.settings["library"])
-            current_scale = ifcopenshell.util.unit.calculate_unit_scale(ifc_file)
-            conversion_factor = library_scale / current_scale
-            return conversion_factor
-
         ifc_file = self.file
         if not self.assume_asset_uniqueness_by_name or element.id() == 0:
             # file.add doesn't convert units for IfcLengthMeasure entities.
-            if element.is_a("IfcLengthMeasure"):
-                return ifc_file.create_entity(element.is_a(), element.wrappedValue * get_conversion_factor())
-            return ifc_file.add(element)
+            if element.is_a("IfcLengthMeasure") and self.needs_conversion():
+                return ifc_file.create_entity(element.is_a(), element.wrappedValue * self.get_conversion_factor())
+            new = ifc_file.add(element)
+            if new.is_a("IfcRoot"):
+                self.guids[new.GlobalId] = new
+            return new
 
         reuse_identities = self.reuse_identities
         element_identity = element.wrapped_data.identity()
         if added_element := reuse_identities.get(element_identity):
             return added_element
 
-        attributes_ = None
-
-        def get_attributes() -> tuple[W.attribute, ...]:
-            nonlocal attributes_
-            if attributes_ is not None:
-                return attributes_
-            attributes_ = element.wrapped_data.declaration().as_entity().all_attributes()
-            return attributes_
-
         # Maybe element already exists.
         if element.is_a("IfcProfileDef"):
             profile_name = element.ProfileName
             if profile_name is not None:
-                existing_profile = next(
-                    (e for e in ifc_file.by_type("IfcProfileDef") if e.ProfileName == profile_name), None
-                )
+                existing_profile = self.get_name_index("IfcProfileDef").get(profile_name)
                 if existing_profile is not None:
                     reuse_identities[element_identity] = existing_profile
                     return existing_profile
         elif element.is_a("IfcMaterial"):
-            material_name = element.Name
-            existing_material = next((e for e in ifc_file.by_type("IfcMaterial") if e.Name == material_name), None)
+            existing_material = self.get_name_index("IfcMaterial").get(element.Name)
             if existing_material is not None:
                 reuse_identities[element_identity] = existing_material
                 return existing_material
@@ -553,16 +622,19 @@ class Usecase:
                 tuple_ = tuple_[0]
             return type(tuple_)
 
-        def is_length_measure(attribute: W.attribute) -> bool:
-            return "<type IfcLengthMeasure: <real>>" in str(attribute.type_of_attribute())
-
         def apply_to_array(arr: Any, func: Callable[[Any], Any]) -> Any:
             if isinstance(arr, tuple):
                 return tuple(apply_to_array(sub, func) for sub in arr)
             return func(arr)
 
-        file_add_ = partial(self.file_add, conversion_factor=conversion_factor)
-        apply_conversion = lambda x: x * conversion_factor
+        apply_conversion = lambda x: x * self.conversion_factor
+
+        def apply_conversion_to_array(arr: tuple) -> Any:
+            try:
+                return (np.asarray(arr, dtype=np.float64) * self.conversion_factor).tolist()
+            except ValueError:
+                # Jagged arrays.
+                return apply_to_array(arr, apply_conversion)
 
         # Migrate attributes to another file.
         for attr_index, attr_value in enumerate(element):
@@ -571,23 +643,20 @@ class Usecase:
                 continue
 
             elif isinstance(attr_value, ifcopenshell.entity_instance):
-                attr_value = file_add_(attr_value)
+                attr_value = self.file_add(attr_value)
 
             elif isinstance(attr_value, tuple):
                 # Assume type is consistent across the tuple.
                 tuple_type = get_tuple_type(attr_value)
                 if tuple_type == ifcopenshell.entity_instance:
-                    attr_value = apply_to_array(attr_value, file_add_)
-                elif tuple_type == float:
-                    attributes = get_attributes()
-                    if is_length_measure(attributes[attr_index]):
-                        get_conversion_factor()  # Ensure conversion factor is not None.
-                        attr_value = apply_to_array(attr_value, apply_conversion)
-
-            elif isinstance(attr_value, float):
-                attributes = get_attributes()
-                if is_length_measure(attributes[attr_index]):
-                    attr_value *= get_conversion_factor()
+                    attr_value = apply_to_array(attr_value, self.file_add)
+                elif tuple_type == float and self.needs_conversion():
+                    if self.get_length_measure_attributes(element)[attr_index]:
+                        attr_value = apply_conversion_to_array(attr_value)
+
+            elif isinstance(attr_value, float) and self.needs_conversion():
+                if self.get_length_measure_attributes(element)[attr_index]:
+                    attr_value *= self.get_conversion_factor()
 
             attrs[attr_index] = attr_value
 
@@ -596,5 +665,8 @@ class Usecase:
         reuse_identities[element_identity] = new
         for attr_index, attr_value in attrs.items():
             new[attr_index] = attr_value
+        self.add_to_name_indexes(new)
+        if new.is_a("IfcRoot"):
+            self.guids[new.GlobalId] = new
 
         return new
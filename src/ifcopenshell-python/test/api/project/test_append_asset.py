@@ -35,6 +35,7 @@ import ifcopenshell.util.element
 import ifcopenshell.util.placement
 import ifcopenshell.util.unit
 import numpy as np
+from ifcopenshell.api.project.append_asset import Usecase
 from ifcopenshell.util.shape_builder import ShapeBuilder
 
 
@@ -303,6 +304,29 @@ class TestAppendAssetIFC2X3(test.bootstrap.IFC2X3):
         assert subcontext.TargetView == "MODEL_VIEW"
         assert subcontext.ParentContext == file_context
 
+    def test_reuse_a_context_created_for_a_previous_subcontext(self):
+        ifcopenshell.api.root.create_entity(self.file, ifc_class="IfcProject")
+        library = ifcopenshell.api.project.create_file(version=self.file.schema)
+        ifcopenshell.api.root.create_entity(library, ifc_class="IfcProject")
+        context = ifcopenshell.api.context.add_context(library, context_type="Model")
+        body = ifcopenshell.api.context.add_context(
+            library, context_type="Model", context_identifier="Body", target_view="MODEL_VIEW", parent=context
+        )
+        axis = ifcopenshell.api.context.add_context(
+            library, context_type="Model", context_identifier="Axis", target_view="GRAPH_VIEW", parent=context
+        )
+
+        usecase = Usecase()
+        usecase.file = self.file
+        usecase.existing_contexts = self.file.by_type("IfcGeometricRepresentationContext")
+        usecase.existing_contexts_index = None
+        new_body = usecase.create_equivalent_context(body)
+        new_axis = usecase.create_equivalent_context(axis)
+        # Both subcontexts share one newly created parent instead of each creating their own.
+        contexts = self.file.by_type("IfcGeometricRepresentationContext", include_subtypes=False)
+        assert len(contexts) == 1
+        assert new_body.ParentContext == new_axis.ParentContext == contexts[0]
+
     def test_append_a_profile_def(self):
         library = ifcopenshell.api.project.create_file(version=self.file.schema)
         profile = library.createIfcIShapeProfileDef()
@@ -643,3 +667,23 @@ class TestAppendAssetIFC4(test.bootstrap.IFC4, TestAppendAssetIFC2X3):
         assert len(profiles) == 1 and profiles[0].ProfileName == "TestProfile"
         materials = self.file.by_type("IfcMaterial")
         assert len(materials) == 1 and materials[0].Name == "TestMaterial"
+
+    def test_not_duplicate_profiles_and_materials_sharing_a_name_within_a_single_asset(self):
+        library = ifcopenshell.api.project.create_file(version=self.file.schema)
+        column_type = ifcopenshell.api.root.create_entity(library, "IfcColumnType")
+        material_set = ifcopenshell.api.material.add_material_set(library, set_type="IfcMaterialProfileSet")
+        for _ in range(2):
+            library_profile = ifcopenshell.api.profile.add_parameterized_profile(library, "IfcCircleProfileDef")
+            library_profile.ProfileName = "TestProfile"
+            material = ifcopenshell.api.material.add_material(library, "TestMaterial")
+            ifcopenshell.api.material.add_profile(library, material_set, material, library_profile)
+        ifcopenshell.api.material.assign_material(
+            library, [column_type], material=material_set, type="IfcMaterialProfileSet"
+        )
+
+        ifcopenshell.api.project.append_asset(self.file, library, column_type)
+        profiles = self.file.by_type("IfcProfileDef")
+        assert len(profiles) == 1 and profiles[0].ProfileName == "TestProfile"
+        materials = self.file.by_type("IfcMaterial")
+        assert len(materials) == 1 and materials[0].Name == "TestMaterial"
+        assert len(self.file.by_type("IfcMaterialProfile")) == 2